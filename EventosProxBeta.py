@@ -13,21 +13,24 @@ FLOWAGILITY SCRAPER - EVENTOS + INFO DETALLADA (con participantes LiveView)
 
 import os
 import sys
-import json
 import re
 import time
-import argparse
 import traceback
-import unicodedata
 import random
+import html
+import shutil
+import threading
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from urllib.parse import urljoin
 from pathlib import Path
-from glob import glob
 
 # Third-party imports
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     from dotenv import load_dotenv
 except ImportError as e:
     print(f"❌ Error importando dependencias: {e}")
@@ -40,7 +43,7 @@ try:
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException
+    from selenium.common.exceptions import TimeoutException, WebDriverException
     from selenium.webdriver.chrome.service import Service
     HAS_SELENIUM = True
 except ImportError as e:
@@ -53,6 +56,23 @@ try:
 except ImportError:
     HAS_WEBDRIVER_MANAGER = False
 
+try:
+    import requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+# Utilidades compartidas por los tres scrapers (texto, JSON, ficheros de salida y esperas)
+from utilidadesEventosProx import (BLOCKED_URL_PATTERNS, clean, latest_events_file,
+                                   parse_module, read_json, wait_for_selector, write_json)
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # ============================== CONFIGURACIÓN GLOBAL ==============================
 
 BASE = "https://www.flowagility.com"
@@ -77,12 +97,42 @@ MAX_SCROLLS    = int(os.getenv("MAX_SCROLLS", "15"))
 SCROLL_WAIT_S  = float(os.getenv("SCROLL_WAIT_S", "3.0"))
 OUT_DIR        = os.getenv("OUT_DIR", "./output")
 LIMIT_EVENTS   = int(os.getenv("LIMIT_EVENTS", "0"))   # 0 = sin límite
+BLOCK_ASSETS   = os.getenv("BLOCK_ASSETS", "true").lower() == "true"   # sin imágenes/CSS/fuentes en Chrome
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager")      # driver.get() vuelve en DOMContentLoaded
+HTTP_EVENTS    = os.getenv("HTTP_EVENTS", "true").lower() == "true"   # listado por HTTP antes que Selenium
+HTML_PARSER    = "lxml" if HAS_LXML else "html.parser"
+CHROME_UA      = os.getenv("CHROME_UA", "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+_CSRF_RE       = re.compile(r'<input[^>]*name="_csrf_token"[^>]*value="([^"]*)"')
+CLUB_RE        = re.compile(r'club|organiz(?:ador|er)', re.IGNORECASE)
+LOC_RE         = re.compile(r'lugar|ubicaci[oó]n|location|place', re.IGNORECASE)
+H1_RE          = re.compile(r'<h1[^>]*>(.*?)</h1>', re.S | re.I)
+DESC_RE        = re.compile(r'<div[^>]*class="[^"]*descri[^"]*"[^>]*>(.*?)</div>', re.S | re.I)
+_TAG_RE        = re.compile(r'<[^>]+>')
+_EMPTY_RE      = re.compile(r"no hay|sin participantes|no results|0 participantes|no participants")
+_BOOKING_RE    = re.compile(r'booking_details')
+_COUNT_TEXT_RE = re.compile(r"(\d+)\s*(participantes?|inscritos?|competidores?)")
+
+# Clases de las tarjetas de evento (filtros BeautifulSoup construidos una sola vez)
+CLS_CONTAINER  = {'class': 'group mb-6'}
+CLS_NAME       = {'class': 'font-caption text-lg text-black truncate -mt-1'}
+CLS_TEXT_XS    = {'class': 'text-xs'}
+CLS_CLUB       = {'class': 'text-xs mb-0.5 mt-0.5'}
+CLS_FLAG       = {'class': 'text-md'}
+SEL_INFO_LINK  = 'a[href*="/info/"]'
+SEL_PART_LINKS = 'a[href*="/participants"], a[href*="/participantes"]'
+ONLY_EVENTS    = SoupStrainer('div', attrs=CLS_CONTAINER)   # solo se construyen las tarjetas al parsear
+EVENT_CARD_SELECTOR = "div.group.mb-6"   # primera tarjeta: listado ya pintado
+INFO_READY_SELECTOR = "h1"               # lo primero que se extrae de /info
+PLACE_MARKERS  = ('Spain', 'España', 'Madrid', 'Barcelona')  # lugar "ciudad / país"
 
 # Budgets/tiempos (ajustables por ENV)
 PER_EVENT_MAX_S      = int(os.getenv("PER_EVENT_MAX_S", "180"))  # límite por evento
 PER_PAGE_MAX_S       = int(os.getenv("PER_PAGE_MAX_S",  "35"))   # espera máx por página de participantes
 LIVEVIEW_READY_MAX_S = int(os.getenv("LIVEVIEW_READY_MAX_S", "12"))
 MAX_RUNTIME_MIN      = int(os.getenv("MAX_RUNTIME_MIN", "0"))    # 0 = sin límite global
+DETAIL_WORKERS       = int(os.getenv("DETAIL_WORKERS", "4"))     # navegadores en paralelo (módulo 2)
+POOL_SIZE            = int(os.getenv("POOL_SIZE", "4"))          # drivers autenticados que se conservan
+MAX_USES             = int(os.getenv("MAX_USES", "50"))          # usos antes de reciclar un driver
 
 print(f"📋 Configuración: HEADLESS={HEADLESS}, OUT_DIR={OUT_DIR}")
 
@@ -94,14 +144,6 @@ def log(message):
 def slow_pause(min_s=1, max_s=2):
     time.sleep(random.uniform(min_s, max_s))
 
-def _clean(s: str) -> str:
-    if not s:
-        return ""
-    s = str(s)
-    s = unicodedata.normalize("NFKC", s)
-    s = re.sub(r"[ \t]+", " ", s)
-    return s.strip(" \t\r\n-•*·:;")
-
 def _clean_output_directory():
     try:
         files_to_keep = ['config.json', 'settings.ini']
@@ -128,6 +170,11 @@ def _time_left(deadline):
 
 # ============================== NAVEGACIÓN / DRIVER ==============================
 
+# Pool de drivers ya autenticados, compartido por todos los módulos
+_DRIVER_POOL = queue.Queue()
+_driver_uses = {}
+_pool_lock = threading.Lock()
+
 def _get_driver(headless=True):
     """Driver preparado para CI: implicit wait bajo y page_load moderado."""
     if not HAS_SELENIUM:
@@ -149,10 +196,16 @@ def _get_driver(headless=True):
     opts.add_argument("--disable-setuid-sandbox")
     opts.add_argument("--ignore-certificate-errors")
     opts.add_argument("--window-size=1920,1080")
-    ua = os.getenv("CHROME_UA", "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    opts.add_argument(f"--user-agent={ua}")
+    opts.add_argument(f"--user-agent={CHROME_UA}")
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option('useAutomationExtension', False)
+    opts.page_load_strategy = PAGE_LOAD_STRATEGY
+    if BLOCK_ASSETS:
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        opts.add_argument("--blink-settings=imagesEnabled=false")
 
     chrome_bin = os.getenv("CHROME_BIN")
     if chrome_bin and os.path.exists(chrome_bin):
@@ -176,9 +229,18 @@ def _get_driver(headless=True):
         # Anti-detección básica
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+        # CSS y fuentes bloqueados a nivel de red (solo interesa el HTML)
+        if BLOCK_ASSETS:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                log(f"No se pudo bloquear recursos vía CDP: {e}")
+
         # Timeouts: explícitos + implicit MUY BAJO (evita micro-cuelgues)
         driver.set_page_load_timeout(75)
         driver.implicitly_wait(2)  # 💡 clave para no bloquear cada find_*
+        driver.wait = WebDriverWait(driver, 20)  # espera reutilizada en cada navegación
         return driver
     except Exception as e:
         log(f"Error creando driver: {e}")
@@ -269,6 +331,144 @@ def _login(driver):
         log(f"❌ Error en login: {e}")
         return False
 
+_HTTP_SESSION = None
+_HTTP_TRIED = False
+_http_lock = threading.Lock()
+
+def _http_session():
+    """Sesión HTTP autenticada y compartida en toda la ejecución (keep-alive). None si no es posible."""
+    global _HTTP_SESSION, _HTTP_TRIED
+    with _http_lock:  # los hilos de detalle la piden a la vez al crear sus drivers
+        if not _HTTP_TRIED:
+            _HTTP_TRIED = True
+            _HTTP_SESSION = _http_login()
+    return _HTTP_SESSION
+
+def _close_http_session():
+    if _HTTP_SESSION:
+        _HTTP_SESSION.close()
+
+def _http_login():
+    """Login por HTTP (formulario + _csrf_token), sin navegador. None si no es posible."""
+    if not HAS_REQUESTS:
+        return None
+    try:
+        session = requests.Session()
+        session.headers.update({"User-Agent": CHROME_UA, "Connection": "keep-alive"})
+        # Conexiones persistentes al host: login y descargas reutilizan el mismo socket TLS
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(4, DETAIL_WORKERS))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        r = session.get(f"{BASE}/user/login", timeout=20)
+        m = _CSRF_RE.search(r.text)
+        if r.status_code != 200 or not m:
+            log("ℹ️  Formulario de login sin _csrf_token (requiere JS)")
+            return None
+        r = session.post(f"{BASE}/user/login", data={
+            "_csrf_token": m.group(1),
+            "user[email]": FLOW_EMAIL,
+            "user[password]": FLOW_PASS,
+        }, timeout=20)
+        if r.status_code >= 400 or "/user/login" in r.url:
+            log("ℹ️  Login HTTP rechazado")
+            return None
+        log("✅ Login HTTP correcto")
+        return session
+    except requests.RequestException as e:
+        log(f"⚠️  Error en login HTTP: {e}")
+        return None
+
+def _fetch_events_html_http():
+    """HTML del listado de eventos por HTTP autenticado; None si no trae tarjetas."""
+    if not HTTP_EVENTS:
+        return None
+    session = _http_session()
+    if not session:
+        return None
+    try:
+        r = session.get(EVENTS_URL, timeout=30)
+        if r.status_code == 200 and 'group mb-6' in r.text:
+            log("⚡ Listado de eventos obtenido por HTTP (sin Selenium)")
+            return r.text
+        log("ℹ️  El listado por HTTP no trae tarjetas; uso Selenium")
+    except requests.RequestException as e:
+        log(f"⚠️  Error descargando eventos por HTTP: {e}")
+    return None
+
+def _login_from_http_session(driver):
+    """Reutiliza en el navegador las cookies de la sesión HTTP ya autenticada (sin formulario de login)."""
+    session = _http_session()
+    if not session:
+        return False
+    try:
+        driver.get(BASE)
+        for c in session.cookies:
+            cookie = {'name': c.name, 'value': c.value, 'path': c.path or '/', 'secure': bool(c.secure)}
+            if c.domain:
+                cookie['domain'] = c.domain
+            driver.add_cookie(cookie)
+        # EVENTS_URL es pública y no prueba nada: con sesión válida, /user/login redirige fuera
+        driver.get(f"{BASE}/user/login")
+        if '/user/login' in driver.current_url:
+            return False
+        log("✅ Sesión HTTP reutilizada en el navegador")
+        return True
+    except Exception as e:
+        log(f"⚠️  No se pudo reutilizar la sesión HTTP: {e}")
+        return False
+
+def _quit_driver(driver):
+    with _pool_lock:
+        _driver_uses.pop(id(driver), None)
+    try: driver.quit()
+    except: pass
+
+@contextmanager
+def acquire():
+    """Driver autenticado del pool (se crea y hace login solo si no hay ninguno libre)."""
+    try:
+        driver = _DRIVER_POOL.get_nowait()
+    except queue.Empty:
+        driver = _get_driver(headless=HEADLESS)
+        if not driver:
+            raise Exception("No se pudo crear el driver de Chrome")
+        if not (_login_from_http_session(driver) or _login(driver)):
+            _quit_driver(driver)
+            raise Exception("No se pudo iniciar sesión")
+    broken = False
+    try:
+        yield driver
+    except WebDriverException:
+        # Sesión caída o colgada: no se devuelve al pool
+        broken = True
+        raise
+    finally:
+        release(driver, broken=broken)
+
+def release(driver, broken=False):
+    """Devuelve el driver al pool; lo cierra si falló, superó MAX_USES o el pool está lleno."""
+    with _pool_lock:
+        uses = _driver_uses.get(id(driver), 0) + 1
+        _driver_uses[id(driver)] = uses
+        # Comprobar y encolar bajo el lock: si no, varios hilos ven hueco a la vez y el pool crece
+        keep = not broken and uses < MAX_USES and _DRIVER_POOL.qsize() < POOL_SIZE
+        if keep:
+            _DRIVER_POOL.put(driver)
+    if not keep:
+        _quit_driver(driver)
+
+def _close_pool():
+    closed = 0
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        _quit_driver(driver)
+        closed += 1
+    if closed:
+        log(f"Navegadores cerrados: {closed}")
+
 def _accept_cookies(driver):
     try:
         cookie_selectors = [
@@ -298,94 +498,141 @@ def _accept_cookies(driver):
         log(f"Error manejando cookies: {e}")
         return False
 
+_COUNT_CARDS_JS = "return document.querySelectorAll('div.group.mb-6').length"
+
 def _full_scroll(driver):
-    last_h = driver.execute_script("return document.body.scrollHeight")
+    """Scroll hasta que dejan de aparecer tarjetas nuevas (sin esperas fijas de SCROLL_WAIT_S)."""
+    prev = driver.execute_script(_COUNT_CARDS_JS) or 0
     for _ in range(MAX_SCROLLS):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(SCROLL_WAIT_S)
-        new_h = driver.execute_script("return document.body.scrollHeight")
-        if new_h == last_h:
+        try:
+            WebDriverWait(driver, SCROLL_WAIT_S, poll_frequency=0.2).until(
+                lambda d: (d.execute_script(_COUNT_CARDS_JS) or 0) > prev
+            )
+        except TimeoutException:
             break
-        last_h = new_h
+        prev = driver.execute_script(_COUNT_CARDS_JS) or 0
+    log(f"Scroll completado: {prev} tarjetas cargadas")
 
 # ============================== MÓDULO 1: EVENTOS ==============================
 
+def _xp_class(cls):
+    """Predicado XPath equivalente a class_='cls' de BeautifulSoup (una clase entre varias)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+if HAS_LXML:
+    # XPath compiladas una vez; cada campo se resuelve en C sobre el subárbol del contenedor
+    _XP_CONTAINERS = etree.XPath("//div[@class='group mb-6']")
+    _XP_NAME       = etree.XPath(".//div[@class='font-caption text-lg text-black truncate -mt-1']")
+    _XP_TEXT_XS    = etree.XPath(f".//div[{_xp_class('text-xs')}]")
+    _XP_CLUB       = etree.XPath(".//div[@class='text-xs mb-0.5 mt-0.5']")
+    _XP_INFO_HREF  = etree.XPath(".//a[contains(@href, '/info/')]/@href")
+    _XP_PART_HREFS = etree.XPath(".//a[contains(@href, '/participants') or contains(@href, '/participantes')]/@href")
+    _XP_FLAG       = etree.XPath(f".//div[{_xp_class('text-md')}]")
+
+def _container_fields_lxml(c):
+    """Campos en bruto de una tarjeta de evento (nodo lxml)."""
+    def first_text(xp):
+        nodes = xp(c)
+        return nodes[0].text_content() if nodes else None
+    info = _XP_INFO_HREF(c)
+    return (c.get('id', ''), first_text(_XP_NAME), [d.text_content() for d in _XP_TEXT_XS(c)],
+            first_text(_XP_CLUB), info[0] if info else None, list(_XP_PART_HREFS(c)), first_text(_XP_FLAG))
+
+def _container_fields_soup(c):
+    """Campos en bruto de una tarjeta de evento (BeautifulSoup, sin lxml)."""
+    def first_text(elem):
+        return elem.get_text() if elem else None
+    info_link = c.select_one(SEL_INFO_LINK)
+    participant_links = c.select(SEL_PART_LINKS)
+    return (c.get('id', ''), first_text(c.find('div', attrs=CLS_NAME)),
+            [d.get_text() for d in c.find_all('div', attrs=CLS_TEXT_XS)],
+            first_text(c.find('div', attrs=CLS_CLUB)),
+            info_link['href'] if info_link else None,
+            [lk.get('href', '') for lk in participant_links],
+            first_text(c.find('div', attrs=CLS_FLAG)))
+
+@lru_cache(maxsize=None)
+def _abs_url(href):
+    """URL absoluta de un enlace de tarjeta; los href del sitio son rutas absolutas (/zone/...)."""
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/") and not href.startswith("//"):
+        return BASE + href
+    return urljoin(BASE, href)
+
+def _build_event(event_id, name, xs_texts, club_text, info_href, participant_hrefs, flag_text):
+    """Evento a partir de los campos en bruto de su tarjeta (común a lxml y BeautifulSoup)."""
+    ev = {}
+    if event_id:
+        ev['id'] = event_id.replace('event-card-', '')
+    if name is not None:
+        ev['nombre'] = clean(name)
+    xs = [clean(t) for t in xs_texts]
+    if xs:
+        ev['fechas'] = xs[0]
+    if len(xs) > 1:
+        ev['organizacion'] = xs[1]
+    if club_text is not None:
+        ev['club'] = clean(club_text)
+    else:
+        for t in xs:
+            if t and not any(x in t for x in ['/', 'Spain', 'España']):
+                ev['club'] = t; break
+    # Lugar con país/ciudad conocidos o, si no, el primer texto corto con '/' (una sola pasada)
+    fallback_place = None
+    for t in xs:
+        if '/' not in t:
+            continue
+        if any(x in t for x in PLACE_MARKERS):
+            ev['lugar'] = t; break
+        if fallback_place is None and len(t) < 100:
+            fallback_place = t
+    if 'lugar' not in ev and fallback_place is not None:
+        ev['lugar'] = fallback_place
+    ev['enlaces'] = {}
+    if info_href:
+        ev['enlaces']['info'] = _abs_url(info_href)
+    for href in participant_hrefs:
+        if '/participants_list' in href or '/participantes' in href:
+            ev['enlaces']['participantes'] = _abs_url(href); break
+    if 'participantes' not in ev['enlaces'] and 'id' in ev:
+        ev['enlaces']['participantes'] = f"{BASE}/zone/events/{ev['id']}/participants_list"
+    ev['pais_bandera'] = clean(flag_text) if flag_text is not None else '🇪🇸'
+    return ev
+
 def extract_events():
     if not HAS_SELENIUM:
         log("Error: Selenium no está instalado"); return None
 
     log("=== MÓDULO 1: EXTRACCIÓN DE EVENTOS BÁSICOS ===")
-    driver = _get_driver(headless=HEADLESS)
-    if not driver:
-        log("❌ No se pudo crear el driver de Chrome"); return None
-
     try:
-        if not _login(driver):
-            raise Exception("No se pudo iniciar sesión")
-
-        log("Navegando a la página de eventos...")
-        driver.get(EVENTS_URL)
-        WebDriverWait(driver, 25).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        _accept_cookies(driver)
-
-        log("Cargando todos los eventos...")
-        _full_scroll(driver)
-        slow_pause(1.5, 2.5)
-
-        page_html = driver.page_source
-        soup = BeautifulSoup(page_html, 'html.parser')
-
-        event_containers = soup.find_all('div', class_='group mb-6')
+        # HTTP autenticado primero; Selenium solo si el listado necesita JS
+        page_html = _fetch_events_html_http()
+        if page_html is None:
+            with acquire() as driver:
+                log("Navegando a la página de eventos...")
+                driver.get(EVENTS_URL)
+                wait_for_selector(driver, EVENT_CARD_SELECTOR, timeout=25, log=log)
+                _accept_cookies(driver)
+
+                log("Cargando todos los eventos...")
+                _full_scroll(driver)
+
+                page_html = driver.page_source
+        if HAS_LXML:
+            event_containers = _XP_CONTAINERS(lxml_html.fromstring(page_html))
+            gather = _container_fields_lxml
+        else:
+            soup = BeautifulSoup(page_html, HTML_PARSER, parse_only=ONLY_EVENTS)
+            event_containers = soup.find_all('div', attrs=CLS_CONTAINER)
+            gather = _container_fields_soup
         log(f"Encontrados {len(event_containers)} contenedores de eventos")
 
         events = []
         for i, c in enumerate(event_containers, 1):
             try:
-                ev = {}
-                event_id = c.get('id', '')
-                if event_id:
-                    ev['id'] = event_id.replace('event-card-', '')
-                name_elem = c.find('div', class_='font-caption text-lg text-black truncate -mt-1')
-                if name_elem:
-                    ev['nombre'] = _clean(name_elem.get_text())
-                date_elem = c.find('div', class_='text-xs')
-                if date_elem:
-                    ev['fechas'] = _clean(date_elem.get_text())
-                org_elems = c.find_all('div', class_='text-xs')
-                if len(org_elems) > 1:
-                    ev['organizacion'] = _clean(org_elems[1].get_text())
-                club_elem = c.find('div', class_='text-xs mb-0.5 mt-0.5')
-                if club_elem:
-                    ev['club'] = _clean(club_elem.get_text())
-                else:
-                    for d in c.find_all('div', class_='text-xs'):
-                        t = _clean(d.get_text())
-                        if t and not any(x in t for x in ['/', 'Spain', 'España']):
-                            ev['club'] = t; break
-                location_divs = c.find_all('div', class_='text-xs')
-                for d in location_divs:
-                    t = _clean(d.get_text())
-                    if '/' in t and any(x in t for x in ['Spain', 'España', 'Madrid', 'Barcelona']):
-                        ev['lugar'] = t; break
-                if 'lugar' not in ev:
-                    for d in location_divs:
-                        t = _clean(d.get_text())
-                        if '/' in t and len(t) < 100:
-                            ev['lugar'] = t; break
-                ev['enlaces'] = {}
-                info_link = c.find('a', href=lambda x: x and '/info/' in x)
-                if info_link:
-                    ev['enlaces']['info'] = urljoin(BASE, info_link['href'])
-                participant_links = c.find_all('a', href=lambda x: x and any(term in x for term in ['/participants', '/participantes']))
-                for lk in participant_links:
-                    href = lk.get('href', '')
-                    if '/participants_list' in href or '/participantes' in href:
-                        ev['enlaces']['participantes'] = urljoin(BASE, href); break
-                if 'participantes' not in ev['enlaces'] and 'id' in ev:
-                    ev['enlaces']['participantes'] = f"{BASE}/zone/events/{ev['id']}/participants_list"
-                flag_elem = c.find('div', class_='text-md')
-                ev['pais_bandera'] = _clean(flag_elem.get_text()) if flag_elem else '🇪🇸'
-
+                ev = _build_event(*gather(c))
                 events.append(ev)
                 log(f"✅ Evento {i} procesado: {ev.get('nombre', 'Sin nombre')}")
             except Exception as e:
@@ -394,10 +641,9 @@ def extract_events():
 
         today_str = datetime.now().strftime("%Y-%m-%d")
         os.makedirs(OUT_DIR, exist_ok=True)
-        with open(os.path.join(OUT_DIR, f'01events_{today_str}.json'), 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
-        with open(os.path.join(OUT_DIR, '01events.json'), 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
+        out_dated = os.path.join(OUT_DIR, f'01events_{today_str}.json')
+        write_json(out_dated, events)
+        shutil.copyfile(out_dated, os.path.join(OUT_DIR, '01events.json'))
 
         log(f"✅ Extracción completada. {len(events)} eventos guardados")
         return events
@@ -406,9 +652,6 @@ def extract_events():
         log(f"❌ Error durante la extracción de eventos: {e}")
         traceback.print_exc()
         return None
-    finally:
-        try: driver.quit(); log("Navegador cerrado")
-        except: pass
 
 # ============================== MÓDULO 2: INFO DETALLADA ==============================
 
@@ -419,7 +662,7 @@ def _extract_description(soup, max_length=800):
         for sel in selectors:
             el = soup.select_one(sel)
             if el:
-                t = _clean(el.get_text())
+                t = clean(el.get_text())
                 if t and len(t) > 50:
                     txt = t; break
         if not txt:
@@ -433,6 +676,59 @@ def _extract_description(soup, max_length=800):
         log(f"Error extrayendo descripción: {e}")
         return ""
 
+def _html_text(fragment):
+    """Texto de un fragmento HTML sin construir árbol (etiquetas fuera + entidades)."""
+    return clean(html.unescape(_TAG_RE.sub('', fragment)))
+
+def _description_from_html(page_html, max_length=800):
+    """
+    Descripción por regex sobre el HTML; '' si no hay bloque significativo o si el bloque
+    tiene divs anidados (el (.*?)</div> se cortaría en el primero: mejor BeautifulSoup).
+    """
+    m = DESC_RE.search(page_html)
+    if not m or '<div' in m.group(1).lower():
+        return ""
+    txt = _html_text(m.group(1))
+    if len(txt) <= 50:
+        return ""
+    if len(txt) > max_length:
+        txt = txt[:max_length] + "... [texto truncado]"
+    return txt
+
+def _first_keyword_tag_text(soup, pattern, accept):
+    """
+    Primer texto aceptado entre las etiquetas cuyo texto contiene `pattern`, en orden de documento.
+    Una sola búsqueda regex sobre los nodos de texto; luego se recorren sus ancestros
+    (de fuera hacia dentro) sin repetir ninguno.
+    """
+    seen = set()
+    for s in soup.find_all(string=pattern):
+        chain = []
+        for tag in s.parents:
+            if id(tag) in seen:
+                break
+            seen.add(id(tag))
+            chain.append(tag)
+        for tag in reversed(chain):
+            if tag is soup:
+                continue
+            tx = clean(tag.get_text())
+            if accept(tx):
+                return tx
+    return None
+
+# Selector común de filas de participante (estado de la página y conteo)
+_BOOKING_SELECTOR = ("[phx-value-booking_id],[phx-value-booking-id],"
+                     "[data-phx-value-booking_id],[data-phx-value-booking-id],"
+                     "[phx-click*=\"booking_details\"],[data-phx-click*=\"booking_details\"],"
+                     "[id^=\"booking-\"],[id^=\"booking_\"]")
+
+# Un solo viaje a chromedriver por sondeo: URL, nº de filas y (si no hay filas) el texto visible
+_PAGE_STATE_JS = """
+    const n = document.querySelectorAll(arguments[0]).length;
+    return [location.href, n, n ? '' : (document.body ? document.body.innerText : '')];
+"""
+
 def _wait_state_participants_page(driver, timeout_s):
     """
     Devuelve: "login" | "ok" | "empty" | "timeout"
@@ -443,36 +739,21 @@ def _wait_state_participants_page(driver, timeout_s):
     t_end = _deadline(timeout_s)
     did_scroll = False
     while _now() < t_end:
-        url = (driver.current_url or "")
-        if "/user/login" in url:
+        try:
+            url, cnt, body_txt = driver.execute_script(_PAGE_STATE_JS, _BOOKING_SELECTOR)
+        except Exception:
+            url, cnt, body_txt = (driver.current_url or ""), 0, ""
+
+        if "/user/login" in (url or ""):
             return "login"
 
         # 1) Conteo rápido en DOM vivo (sin depender de phx-connected)
-        try:
-            cnt = driver.execute_script("""
-                const qs = document.querySelectorAll(
-                  '[phx-value-booking_id],'+
-                  '[phx-value-booking-id],'+
-                  '[data-phx-value-booking_id],'+
-                  '[data-phx-value-booking-id],'+
-                  '[phx-click*="booking_details"],'+
-                  '[data-phx-click*="booking_details"],'+
-                  '[id^="booking-"],[id^="booking_"]'
-                );
-                return qs ? qs.length : 0;
-            """) or 0
-            if int(cnt) > 0:
-                return "ok"
-        except Exception:
-            pass
+        if int(cnt or 0) > 0:
+            return "ok"
 
         # 2) Texto que indica vacío
-        try:
-            body_txt = driver.find_element(By.TAG_NAME, "body").text.lower()
-            if re.search(r"no hay|sin participantes|no results|0 participantes|no participants", body_txt):
-                return "empty"
-        except Exception:
-            pass
+        if body_txt and _EMPTY_RE.search(body_txt.lower()):
+            return "empty"
 
         # 3) Micro-scroll para disparar lazy/hydrate
         if not did_scroll:
@@ -492,15 +773,7 @@ def _count_participants_fast(driver) -> int:
     try:
         result = driver.execute_script("""
             const set = new Set();
-            const nodes = document.querySelectorAll(
-              '[phx-value-booking_id],'+
-              '[phx-value-booking-id],'+
-              '[data-phx-value-booking_id],'+
-              '[data-phx-value-booking-id],'+
-              '[phx-click*="booking_details"],'+
-              '[data-phx-click*="booking_details"],'+
-              '[id^="booking-"],[id^="booking_"]'
-            );
+            const nodes = document.querySelectorAll(arguments[0]);
             for (const n of nodes) {
               const v = n.getAttribute('phx-value-booking_id')
                      || n.getAttribute('phx-value-booking-id')
@@ -510,7 +783,7 @@ def _count_participants_fast(driver) -> int:
               if (v) set.add(v);
             }
             return set.size || nodes.length || 0;
-        """) or 0
+        """, _BOOKING_SELECTOR) or 0
         if result and int(result) > 0:
             return int(result)
     except Exception:
@@ -520,15 +793,15 @@ def _count_participants_fast(driver) -> int:
 def _count_participants_from_html(html: str) -> int:
     """Fallback con BeautifulSoup sobre el DOM actual."""
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         # A) toggles con booking_id
         elems = soup.find_all(attrs={'phx-value-booking_id': True}) \
               + soup.find_all(attrs={'phx-value-booking-id': True})
         if elems:
             return len(elems)
         # B) phx-click que contenga booking_details
-        elems = soup.find_all(attrs={'phx-click': re.compile(r'booking_details')}) \
-              + soup.find_all(attrs={'data-phx-click': re.compile(r'booking_details')})
+        elems = soup.find_all(attrs={'phx-click': _BOOKING_RE}) \
+              + soup.find_all(attrs={'data-phx-click': _BOOKING_RE})
         if elems:
             return len(elems)
         # C) tablas
@@ -542,7 +815,7 @@ def _count_participants_from_html(html: str) -> int:
                     return len(rows)-1
         # D) número en texto
         txt = soup.get_text(" ").lower()
-        m = re.search(r"(\d+)\s*(participantes?|inscritos?|competidores?)", txt)
+        m = _COUNT_TEXT_RE.search(txt)
         if m:
             n = int(m.group(1))
             if 0 <= n <= 5000:
@@ -551,6 +824,123 @@ def _count_participants_from_html(html: str) -> int:
         pass
     return 0
 
+def _process_event(driver, i, total, event):
+    """Info + participantes de un evento con un driver ya autenticado."""
+    try:
+        preserved = ['id', 'nombre', 'fechas', 'organizacion', 'club', 'lugar', 'enlaces', 'pais_bandera']
+        detailed_event = {k: event.get(k, '') for k in preserved}
+        detailed_event['numero_participantes'] = 0
+        detailed_event['participantes_info'] = 'No disponible'
+
+        # ===== INFO DEL EVENTO (/info) =====
+        info_processed = False
+        if 'enlaces' in event and 'info' in event['enlaces']:
+            info_url = event['enlaces']['info']
+            log(f"Procesando evento {i}/{total}: {event.get('nombre','Sin nombre')}")
+            try:
+                driver.get(info_url)
+                wait_for_selector(driver, INFO_READY_SELECTOR, log=log)
+                page_html = driver.page_source
+
+                # El árbol BeautifulSoup solo se construye si la regex no basta
+                soup = None
+                def _soup():
+                    nonlocal soup
+                    if soup is None:
+                        soup = BeautifulSoup(page_html, HTML_PARSER)
+                    return soup
+
+                extra = {}
+                if not detailed_event.get('club') or detailed_event.get('club') in ['N/D', '']:
+                    tx = _first_keyword_tag_text(_soup(), CLUB_RE, lambda t: t and len(t) < 100)
+                    if tx: detailed_event['club'] = tx
+                if not detailed_event.get('lugar') or detailed_event.get('lugar') in ['N/D', '']:
+                    tx = _first_keyword_tag_text(_soup(), LOC_RE, lambda t: t and ('/' in t or any(x in t for x in ['Spain','España'])))
+                    if tx: detailed_event['lugar'] = tx
+                title = H1_RE.search(page_html)
+                if title: extra['titulo_completo'] = _html_text(title.group(1))
+                desc = _description_from_html(page_html, max_length=800) or _extract_description(_soup(), max_length=800)
+                if desc: extra['descripcion'] = desc
+                detailed_event['informacion_adicional'] = extra
+                info_processed = True
+            except Exception as e:
+                log(f"  ❌ Error procesando información: {e}")
+
+        # ===== PARTICIPANTES (rápido + robusto) =====
+        if 'enlaces' in event and 'participantes' in event['enlaces']:
+            plist = event['enlaces']['participantes']
+            log(f"  Extrayendo número de participantes de: {plist}")
+
+            # Límite por evento
+            event_deadline = _deadline(PER_EVENT_MAX_S)
+
+            try:
+                driver.get(plist)
+                driver.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                _accept_cookies(driver)  # <- acepta si vuelve a salir banner
+
+                # Estado determinista con tope corto
+                state = _wait_state_participants_page(driver, timeout_s=min(PER_PAGE_MAX_S, _time_left(event_deadline)))
+
+                # Re-login una vez si caducó sesión
+                if state == "login":
+                    log("  ℹ️ Sesión caducada; reintentando login…")
+                    if _login(driver):
+                        driver.get(plist)
+                        driver.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                        _accept_cookies(driver)
+                        state = _wait_state_participants_page(driver, timeout_s=min(PER_PAGE_MAX_S, _time_left(event_deadline)))
+                    else:
+                        state = "timeout"
+
+                if state == "empty":
+                    detailed_event['numero_participantes'] = 0
+                    detailed_event['participantes_info'] = 'Sin participantes'
+                    log("  ⚠️  Lista de participantes vacía (empty)")
+
+                elif state == "ok":
+                    # 1º JS vivo
+                    n = _count_participants_fast(driver)
+                    # 2º Fallback HTML si JS da 0
+                    if n == 0:
+                        n = _count_participants_from_html(driver.page_source)
+                    if n > 0:
+                        detailed_event['numero_participantes'] = n
+                        detailed_event['participantes_info'] = f"{n} participantes"
+                        log(f"  ✅ Encontrados {n} participantes")
+                    else:
+                        detailed_event['numero_participantes'] = 0
+                        detailed_event['participantes_info'] = 'Sin participantes'
+                        log("  ⚠️  No se encontraron participantes tras conteos (JS/HTML)")
+
+                else:
+                    detailed_event['numero_participantes'] = 0
+                    detailed_event['participantes_info'] = 'Timeout esperando participantes'
+                    log("  ⏱️  Timeout esperando lista; marco 0 y continúo")
+
+            except Exception as e:
+                log(f"  ❌ Error accediendo a participantes: {e}")
+                detailed_event['numero_participantes'] = 0
+                detailed_event['participantes_info'] = f"Error: {str(e)}"
+
+        detailed_event['timestamp_extraccion'] = datetime.now().isoformat()
+        detailed_event['procesado_info'] = info_processed
+        slow_pause(0.6, 1.4)
+        return detailed_event
+
+    except Exception as e:
+        log(f"❌ Error procesando evento {i}: {e}")
+        return _mark_event_error(event, e)
+
+def _mark_event_error(event, e):
+    """Conserva el evento básico marcándolo como no procesado."""
+    event['timestamp_extraccion'] = datetime.now().isoformat()
+    event['procesado_info'] = False
+    event['numero_participantes'] = 0
+    event['participantes_info'] = f"Error: {str(e)}"
+    return event
+
+
 def extract_detailed_info():
     """Extraer info detallada incluyendo número de participantes (rápido y con límites)."""
     if not HAS_SELENIUM:
@@ -559,11 +949,10 @@ def extract_detailed_info():
     log("=== MÓDULO 2: EXTRACCIÓN DE INFORMACIÓN DETALLADA ===")
 
     # Archivo de eventos más reciente
-    event_files = glob(os.path.join(OUT_DIR, "01events_*.json"))
-    if not event_files:
+    latest = latest_events_file(OUT_DIR)
+    if not latest:
         log("❌ No se encontraron archivos de eventos"); return None
-    latest = max(event_files, key=os.path.getctime)
-    events = json.load(open(latest, "r", encoding="utf-8"))
+    events = read_json(latest)
     log(f"✅ Cargados {len(events)} eventos desde {latest}")
 
     # Limitar nº de eventos si se pide
@@ -571,140 +960,38 @@ def extract_detailed_info():
         events = events[:LIMIT_EVENTS]
         log(f"🔎 LIMIT_EVENTS activo: procesaré {len(events)} eventos")
 
-    driver = _get_driver(headless=HEADLESS)
-    if not driver:
-        log("❌ No se pudo crear el driver de Chrome"); return None
-
-    try:
-        if not _login(driver):
-            raise Exception("No se pudo iniciar sesión")
+    # Tope global (si aplica)
+    global_deadline = _deadline(MAX_RUNTIME_MIN * 60) if MAX_RUNTIME_MIN > 0 else None
+    total = len(events)
 
-        # Tope global (si aplica)
-        global_deadline = _deadline(MAX_RUNTIME_MIN * 60) if MAX_RUNTIME_MIN > 0 else None
-
-        detailed_events = []
-
-        for i, event in enumerate(events, 1):
-            # Salida ordenada si el tope global vence
-            if global_deadline and _now() >= global_deadline:
-                log("⏹️  Tiempo global agotado; guardo y salgo del bucle.")
-                break
-
-            try:
-                preserved = ['id', 'nombre', 'fechas', 'organizacion', 'club', 'lugar', 'enlaces', 'pais_bandera']
-                detailed_event = {k: event.get(k, '') for k in preserved}
-                detailed_event['numero_participantes'] = 0
-                detailed_event['participantes_info'] = 'No disponible'
-
-                # ===== INFO DEL EVENTO (/info) =====
-                info_processed = False
-                if 'enlaces' in event and 'info' in event['enlaces']:
-                    info_url = event['enlaces']['info']
-                    log(f"Procesando evento {i}/{len(events)}: {event.get('nombre','Sin nombre')}")
-                    try:
-                        driver.get(info_url)
-                        WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                        slow_pause(1.2, 2.2)
-                        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-                        extra = {}
-                        if not detailed_event.get('club') or detailed_event.get('club') in ['N/D', '']:
-                            club_elems = soup.find_all(lambda t: any(w in t.get_text().lower() for w in ['club','organizador','organizer']))
-                            for el in club_elems:
-                                tx = _clean(el.get_text())
-                                if tx and len(tx) < 100: detailed_event['club'] = tx; break
-                        if not detailed_event.get('lugar') or detailed_event.get('lugar') in ['N/D', '']:
-                            locs = soup.find_all(lambda t: any(w in t.get_text().lower() for w in ['lugar','ubicacion','location','place']))
-                            for el in locs:
-                                tx = _clean(el.get_text())
-                                if tx and ('/' in tx or any(x in tx for x in ['Spain','España'])):
-                                    detailed_event['lugar'] = tx; break
-                        title = soup.find('h1')
-                        if title: extra['titulo_completo'] = _clean(title.get_text())
-                        desc = _extract_description(soup, max_length=800)
-                        if desc: extra['descripcion'] = desc
-                        detailed_event['informacion_adicional'] = extra
-                        info_processed = True
-                    except Exception as e:
-                        log(f"  ❌ Error procesando información: {e}")
-
-                # ===== PARTICIPANTES (rápido + robusto) =====
-                if 'enlaces' in event and 'participantes' in event['enlaces']:
-                    plist = event['enlaces']['participantes']
-                    log(f"  Extrayendo número de participantes de: {plist}")
-
-                    # Límite por evento
-                    event_deadline = _deadline(PER_EVENT_MAX_S)
-
-                    try:
-                        driver.get(plist)
-                        WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                        _accept_cookies(driver)  # <- acepta si vuelve a salir banner
-
-                        # Estado determinista con tope corto
-                        state = _wait_state_participants_page(driver, timeout_s=min(PER_PAGE_MAX_S, _time_left(event_deadline)))
-
-                        # Re-login una vez si caducó sesión
-                        if state == "login":
-                            log("  ℹ️ Sesión caducada; reintentando login…")
-                            if _login(driver):
-                                driver.get(plist)
-                                WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                                _accept_cookies(driver)
-                                state = _wait_state_participants_page(driver, timeout_s=min(PER_PAGE_MAX_S, _time_left(event_deadline)))
-                            else:
-                                state = "timeout"
-
-                        if state == "empty":
-                            detailed_event['numero_participantes'] = 0
-                            detailed_event['participantes_info'] = 'Sin participantes'
-                            log("  ⚠️  Lista de participantes vacía (empty)")
-
-                        elif state == "ok":
-                            # 1º JS vivo
-                            n = _count_participants_fast(driver)
-                            # 2º Fallback HTML si JS da 0
-                            if n == 0:
-                                n = _count_participants_from_html(driver.page_source)
-                            if n > 0:
-                                detailed_event['numero_participantes'] = n
-                                detailed_event['participantes_info'] = f"{n} participantes"
-                                log(f"  ✅ Encontrados {n} participantes")
-                            else:
-                                detailed_event['numero_participantes'] = 0
-                                detailed_event['participantes_info'] = 'Sin participantes'
-                                log("  ⚠️  No se encontraron participantes tras conteos (JS/HTML)")
-
-                        else:
-                            detailed_event['numero_participantes'] = 0
-                            detailed_event['participantes_info'] = 'Timeout esperando participantes'
-                            log("  ⏱️  Timeout esperando lista; marco 0 y continúo")
-
-                    except Exception as e:
-                        log(f"  ❌ Error accediendo a participantes: {e}")
-                        detailed_event['numero_participantes'] = 0
-                        detailed_event['participantes_info'] = f"Error: {str(e)}"
-
-                detailed_event['timestamp_extraccion'] = datetime.now().isoformat()
-                detailed_event['procesado_info'] = info_processed
-                detailed_events.append(detailed_event)
-                slow_pause(0.6, 1.4)
+    def _task(i, event):
+        # Salida ordenada si el tope global vence
+        if global_deadline and _now() >= global_deadline:
+            return None
+        try:
+            with acquire() as driver:
+                return _process_event(driver, i, total, event)
+        except Exception as e:
+            # Sin driver (Chrome no arranca o falla el login): el evento queda con error,
+            # pero no se pierde lo ya procesado por los demás hilos
+            log(f"❌ Sin navegador para el evento {i}: {e}")
+            return _mark_event_error(event, e)
 
-            except Exception as e:
-                log(f"❌ Error procesando evento {i}: {e}")
-                event['timestamp_extraccion'] = datetime.now().isoformat()
-                event['procesado_info'] = False
-                event['numero_participantes'] = 0
-                event['participantes_info'] = f"Error: {str(e)}"
-                detailed_events.append(event)
-                continue
+    try:
+        # Cada tarea toma un driver autenticado del pool; la latencia de red se solapa entre eventos
+        log(f"⚙️  Procesando con {DETAIL_WORKERS} navegadores en paralelo")
+        with ThreadPoolExecutor(max_workers=max(1, DETAIL_WORKERS)) as executor:
+            results = list(executor.map(_task, range(1, total + 1), events))
+        detailed_events = [r for r in results if r is not None]
+        if len(detailed_events) < total:
+            log("⏹️  Tiempo global agotado; guardo lo procesado.")
 
         # Guardar
         today = datetime.now().strftime("%Y-%m-%d")
         out_dated  = os.path.join(OUT_DIR, f'02info_{today}.json')
         out_latest = os.path.join(OUT_DIR, '02info.json')
-        with open(out_dated,  'w', encoding='utf-8') as f: json.dump(detailed_events, f, ensure_ascii=False, indent=2)
-        with open(out_latest, 'w', encoding='utf-8') as f: json.dump(detailed_events, f, ensure_ascii=False, indent=2)
+        write_json(out_dated, detailed_events)
+        shutil.copyfile(out_dated, out_latest)
         log(f"✅ Información detallada guardada en {out_dated}")
 
         # Resumen
@@ -733,9 +1020,6 @@ def extract_detailed_info():
         log(f"❌ Error durante la extracción detallada: {e}")
         traceback.print_exc()
         return None
-    finally:
-        try: driver.quit()
-        except: pass
 
 # ============================== MAIN ==============================
 
@@ -744,17 +1028,16 @@ def main():
     print(f"📂 Directorio de salida: {OUT_DIR}")
     print("=" * 80)
 
+    # Primero la CLI: --help o un --module inválido salen sin tocar OUT_DIR
+    module = parse_module(sys.argv[1:])
+
     os.makedirs(OUT_DIR, exist_ok=True)
     _clean_output_directory()
 
-    parser = argparse.ArgumentParser(description="FlowAgility Scraper - Eventos e Info Detallada")
-    parser.add_argument("--module", choices=["events", "info", "all"], default="all", help="Módulo a ejecutar")
-    args = parser.parse_args()
-
     try:
         success = True
 
-        if args.module in ["events", "all"]:
+        if module in ["events", "all"]:
             log("🏁 INICIANDO EXTRACCIÓN DE EVENTOS BÁSICOS")
             events = extract_events()
             if not events:
@@ -763,7 +1046,7 @@ def main():
             else:
                 log("✅ Eventos básicos extraídos correctamente")
 
-        if args.module in ["info", "all"] and success:
+        if module in ["info", "all"] and success:
             log("🏁 INICIANDO EXTRACCIÓN DE INFORMACIÓN DETALLADA")
             detailed = extract_detailed_info()
             if not detailed:
@@ -774,10 +1057,10 @@ def main():
         if success:
             log("🎉 PROCESO COMPLETADO EXITOSAMENTE")
             print(f"\n📁 ARCHIVOS GENERADOS EN {OUT_DIR}:")
-            for file in sorted(glob(os.path.join(OUT_DIR, "*"))):
-                if os.path.isfile(file):
-                    size = os.path.getsize(file)
-                    print(f"   {os.path.basename(file)} - {size} bytes")
+            with os.scandir(OUT_DIR) as it:
+                entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+            for entry in entries:
+                print(f"   {entry.name} - {entry.stat().st_size} bytes")
         else:
             log("❌ PROCESO COMPLETADO CON ERRORES")
 
@@ -787,6 +1070,9 @@ def main():
         log(f"❌ ERROR CRÍTICO DURANTE LA EJECUCIÓN: {e}")
         traceback.print_exc()
         return False
+    finally:
+        _close_pool()
+        _close_http_session()
 
 if __name__ == "__main__":
     ok = main()
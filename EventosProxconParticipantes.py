@@ -91,21 +91,21 @@ python EventosProxconParticipantes.py [--module events|info|all]
 
 import os
 import sys
-import json
 import re
 import time
-import argparse
+import logging
+import logging.handlers
 import traceback
-import unicodedata
 import random
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin
 from pathlib import Path
-from glob import glob
 
 # Third-party imports
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
     from dotenv import load_dotenv
 except ImportError as e:
     print(f"❌ Error importando dependencias: {e}")
@@ -118,7 +118,7 @@ try:
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
     from selenium.webdriver.chrome.service import Service
     HAS_SELENIUM = True
 except ImportError as e:
@@ -131,6 +131,23 @@ try:
 except ImportError:
     HAS_WEBDRIVER_MANAGER = False
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+# Utilidades compartidas por los tres scrapers (texto, JSON, ficheros de salida y esperas)
+from utilidadesEventosProx import (BLOCKED_URL_PATTERNS, clean, latest_events_file,
+                                   parse_module, read_json, wait_for_selector, write_json)
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # ============================== CONFIGURACIÓN GLOBAL ==============================
 
 # Configuración base
@@ -154,33 +171,118 @@ HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 INCOGNITO = os.getenv("INCOGNITO", "true").lower() == "true"
 MAX_SCROLLS = int(os.getenv("MAX_SCROLLS", "15"))
 SCROLL_WAIT_S = float(os.getenv("SCROLL_WAIT_S", "3.0"))
+SCROLL_QUIET_MS = int(os.getenv("SCROLL_QUIET_MS", "500"))
+TALL_VIEWPORT_H = int(os.getenv("TALL_VIEWPORT_H", "20000"))
 OUT_DIR = os.getenv("OUT_DIR", "./output")
+# Parser de BeautifulSoup: lxml (C) es bastante más rápido que html.parser
+HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+# Al parsear la lista de eventos solo se construyen las tarjetas (y su contenido)
+ONLY_EVENTS = SoupStrainer('div', attrs={'class': 'group mb-6'})
+# Primera tarjeta de evento: indica que el listado ya está pintado
+EVENT_CARD_SELECTOR = "div.group.mb-6"
+# Textos que delatan un lugar "ciudad / país" en la tarjeta de evento
+PLACE_MARKERS = ('Spain', 'España', 'Madrid', 'Barcelona')
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager")  # driver.get() vuelve en DOMContentLoaded
+BLOCK_ASSETS = os.getenv("BLOCK_ASSETS", "true").lower() == "true"
+HTTP_PARTICIPANTS = os.getenv("HTTP_PARTICIPANTS", "true").lower() == "true"  # primer render de LiveView por HTTP
+HTTP_WORKERS = int(os.getenv("HTTP_WORKERS", "4"))  # descargas HTTP simultáneas por lote
+MAX_TABS = int(os.getenv("MAX_TABS", "4"))  # pestañas del mismo navegador cargando en paralelo
+LOG_FILE = os.getenv("LOG_FILE", "")  # si se define, copia del log en disco (escrita por lotes)
+LIST_READY_S = float(os.getenv("LIST_READY_S", "3"))  # espera máx. a que pinten las filas tras hidratar
 
 # 🔧 MODO PRUEBAS - SOLO 2 PRIMEROS EVENTOS
 MAX_EVENTS_FOR_TESTING = 2
 
+# Expresiones regulares compiladas una sola vez (limpieza y extracción de participantes)
+BOOKING_NUM_RE = re.compile(r"(\d{3,})")
+# Cada patrón va con un literal que debe aparecer en el texto: si falta, no se ejecuta la regex
+PARTICIPANT_COUNT_RES = [
+    ('participante', re.compile(r'(\d+)\s*participantes?')),
+    ('inscrito', re.compile(r'(\d+)\s*inscritos?')),
+    ('competidor', re.compile(r'(\d+)\s*competidores?')),
+    ('total:', re.compile(r'total:\s*(\d+)')),
+]
+DATE_RES = [
+    re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', re.IGNORECASE),
+    re.compile(r'\d{1,2}\s+(?:ene|feb|mar|abr|may|jun|jul|ago|sep|oct|nov|dic)\w*\s+\d{4}', re.IGNORECASE),
+    re.compile(r'\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}', re.IGNORECASE),
+]
+# Selectores del conteo de participantes y script que los evalúa de una vez en el navegador
+BOOKING_SELECTOR = ", ".join([
+    "[phx-value-booking_id]",              # atributo estándar
+    "[data-phx-value-booking_id]",         # a veces data-*
+    '[phx-click="booking_details"]',       # botones que abren detalles
+    '[phx-click="booking_details_show"]',  # otro tipo de botón
+    "[data-phx-click*=booking_details]",   # variantes
+    '[id^="booking-"]',                    # ids como booking-12345
+    '[class*="participant"]',              # clases con participant
+    '[class*="competitor"]',               # clases con competitor
+])
+CARD_SELECTOR = "div[class*='card'], div[class*='item'], div[class*='row']"
+# Posibles nombres de participantes, por orden de prioridad ([class*="name"] es muy genérico y va detrás)
+NAME_SELECTORS = (
+    '[class*="participant"]',
+    '[class*="competitor"]',
+    '[class*="name"]',
+    '[class*="guia"]',
+    '[class*="guide"]',
+)
+NAME_LABEL_WORDS = ('participant', 'competitor', 'name', 'nombre')
+MAX_PARTICIPANT_NAMES = 5
+PARTICIPANT_KEYWORDS = ('dorsal', 'guía', 'guia', 'perro', 'booking')
+PARTICIPANTS_SNAPSHOT_JS = """
+    const [bookingSel, cardSel, keywords] = arguments;
+    const bids = Array.from(document.querySelectorAll(bookingSel), el =>
+        el.getAttribute('phx-value-booking_id') || el.getAttribute('data-phx-value-booking_id') || el.id || '');
+    const tables = Array.from(document.querySelectorAll('table'), t => {
+        const rows = t.querySelectorAll('tr');
+        return [rows.length, rows.length ? rows[0].innerText : ''];
+    });
+    let cards = 0;
+    for (const c of document.querySelectorAll(cardSel)) {
+        const txt = (c.innerText || '').toLowerCase();
+        if (keywords.some(k => txt.includes(k))) cards++;
+    }
+    const body = document.body ? document.body.innerText : '';
+    return [bids, tables, cards, body];
+"""
+LIVEVIEW_READY_JS = ("return document.documentElement.classList.contains('phx-connected')"
+                     " || !!document.querySelector('[data-phx-root]')")
+LIST_PAINTED_JS = "return !!document.querySelector(arguments[0] + ', table tr + tr')"
+LOCATION_INDICATORS = ('lugar', 'ubicacion', 'location', 'place', 'ciudad', 'city')
+HAS_LETTER_RE = re.compile(r'[a-zA-ZáéíóúÁÉÍÓÚñÑ]')
+
 print(f"📋 Configuración: HEADLESS={HEADLESS}, OUT_DIR={OUT_DIR}")
 print(f"🔧 MODO PRUEBAS: Procesando solo {MAX_EVENTS_FOR_TESTING} eventos")
 
 # ============================== UTILIDADES GENERALES ==============================
 
+def _build_logger():
+    """Logger a stdout (mismo formato que antes) y, opcionalmente, a LOG_FILE con escritura en bloque."""
+    logger = logging.getLogger("flowagility")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    fmt = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(fmt)
+    logger.addHandler(console)
+    if LOG_FILE:
+        file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        file_handler.setFormatter(fmt)
+        # Se vuelca cada 200 mensajes, ante un error o al salir (logging.shutdown)
+        logger.addHandler(logging.handlers.MemoryHandler(200, flushLevel=logging.ERROR, target=file_handler))
+    return logger
+
+_LOGGER = _build_logger()
+
 def log(message):
     """Función de logging"""
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+    _LOGGER.info(message)
 
 def slow_pause(min_s=1, max_s=2):
     """Pausa aleatoria"""
     time.sleep(random.uniform(min_s, max_s))
 
-def _clean(s: str) -> str:
-    """Limpia y normaliza texto"""
-    if not s:
-        return ""
-    s = str(s)
-    s = unicodedata.normalize("NFKC", s)
-    s = re.sub(r"[ \t]+", " ", s)
-    return s.strip(" \t\r\n-•*·:;")
-
 def _clean_output_directory():
     """Limpiar archivos antiguos del directorio de output"""
     try:
@@ -195,7 +297,7 @@ def _clean_output_directory():
                     log(f"🧹 Eliminado archivo antiguo: {file}")
         
         log("✅ Directorio de output limpiado")
-    except Exception as e:
+    except OSError as e:
         log(f"⚠️  Error limpiando directorio: {e}")
 
 # ============================== FUNCIONES DE NAVEGACIÓN ==============================
@@ -228,6 +330,12 @@ def _get_driver(headless=True):
     # Configuración adicional para evitar detección
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option('useAutomationExtension', False)
+    opts.page_load_strategy = PAGE_LOAD_STRATEGY
+    if BLOCK_ASSETS:
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
     
     try:
         # USAR CHROME Y CHROMEDRIVER INSTALADOS CORRECTAMENTE
@@ -256,8 +364,17 @@ def _get_driver(headless=True):
         # Ejecutar script para evitar detección
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        if BLOCK_ASSETS:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                log(f"No se pudo bloquear recursos vía CDP: {e}")
+        
         driver.set_page_load_timeout(120)
-        driver.implicitly_wait(45)
+        # Sin espera implícita: las esperas son explícitas (WebDriverWait / _wait_for_selector)
+        # y una implícita alta alarga cada sondeo fallido de find_elements
+        driver.implicitly_wait(0)
         return driver
         
     except Exception as e:
@@ -267,6 +384,36 @@ def _get_driver(headless=True):
         traceback.print_exc()
         return None
 
+# Un único navegador compartido por los dos módulos (se cierra al final de main)
+_DRIVER = None
+
+def _shared_driver():
+    """Devuelve el driver compartido, creándolo la primera vez."""
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = _get_driver(headless=HEADLESS)
+    return _DRIVER
+
+def _close_shared_driver():
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+            log("Navegador cerrado")
+        except Exception:
+            # Cierre en el finally de main: ningún fallo al salir (p. ej. conexión con
+            # chromedriver ya caída) debe tapar el error original
+            pass
+        _DRIVER = None
+
+def _ensure_login(driver):
+    """Inicia sesión solo si este driver no lo ha hecho ya."""
+    if getattr(driver, "_flow_logged_in", False):
+        return True
+    ok = _login(driver)
+    driver._flow_logged_in = ok
+    return ok
+
 def _login(driver):
     """Inicia sesión en FlowAgility"""
     if not driver:
@@ -400,43 +547,41 @@ def _login(driver):
 def _accept_cookies(driver):
     """Aceptar cookies si es necesario"""
     try:
-        cookie_selectors = [
-            'button[aria-label="Accept all"]',
-            'button[aria-label="Aceptar todo"]',
-            '[data-testid="uc-accept-all-button"]',
-            'button[mode="primary"]'
-        ]
-        
-        for selector in cookie_selectors:
-            try:
-                cookie_btn = driver.find_elements(By.CSS_SELECTOR, selector)
-                if cookie_btn:
-                    cookie_btn[0].click()
-                    slow_pause(0.5, 1)
-                    log("Cookies aceptadas")
-                    return True
-            except:
-                continue
-                
-        # Fallback con JavaScript
-        driver.execute_script("""
+        # Selectores + fallback por texto en una sola llamada al navegador
+        clicked = driver.execute_script("""
+            const selectors = [
+                'button[aria-label="Accept all"]',
+                'button[aria-label="Aceptar todo"]',
+                '[data-testid="uc-accept-all-button"]',
+                'button[mode="primary"]'
+            ];
+            for (const sel of selectors) {
+                const el = document.querySelector(sel);
+                if (el) {
+                    el.click();
+                    return true;
+                }
+            }
             const buttons = document.querySelectorAll('button');
             for (const btn of buttons) {
                 if (/aceptar|accept|consent|agree/i.test(btn.textContent)) {
                     btn.click();
-                    break;
+                    return true;
                 }
             }
+            return false;
         """)
-        slow_pause(0.5, 1)
+        if clicked:
+            slow_pause(0.5, 1)
+            log("Cookies aceptadas")
         return True
         
     except Exception as e:
         log(f"Error manejando cookies: {e}")
         return False
 
-def _full_scroll(driver):
-    """Scroll completo para cargar todos los elementos"""
+def _full_scroll_polling(driver):
+    """Scroll completo por sondeo de altura (fallback sin CDP)"""
     last_height = driver.execute_script("return document.body.scrollHeight")
     for _ in range(MAX_SCROLLS):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -446,8 +591,122 @@ def _full_scroll(driver):
             break
         last_height = new_height
 
+def _full_scroll(driver):
+    """Scroll completo para cargar todos los elementos"""
+    # Viewport muy alto por CDP + espera por eventos del DOM en vez de sleeps fijos
+    max_wait_s = MAX_SCROLLS * SCROLL_WAIT_S
+    try:
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": 1920,
+            "height": TALL_VIEWPORT_H,
+            "deviceScaleFactor": 1,
+            "mobile": False
+        })
+    except Exception as e:
+        log(f"⚠️  CDP no disponible, uso scroll por sondeo: {e}")
+        _full_scroll_polling(driver)
+        return
+    
+    try:
+        previous_script_timeout = driver.timeouts.script
+    except Exception:
+        previous_script_timeout = 30  # valor por defecto de WebDriver
+    try:
+        driver.set_script_timeout(max_wait_s + 5)
+        total = driver.execute_async_script("""
+            const quietMs = arguments[0];
+            const maxMs = arguments[1];
+            const done = arguments[arguments.length - 1];
+            const count = () => document.querySelectorAll('div.group.mb-6').length;
+            let last = count();
+            let quiet = null;
+            let hard = null;
+            const finish = () => {
+                observer.disconnect();
+                clearTimeout(quiet);
+                clearTimeout(hard);
+                done(count());
+            };
+            const observer = new MutationObserver(() => {
+                const n = count();
+                if (n !== last) {
+                    last = n;
+                    window.scrollTo(0, document.body.scrollHeight);
+                    clearTimeout(quiet);
+                    quiet = setTimeout(finish, quietMs);
+                }
+            });
+            observer.observe(document.body, {childList: true, subtree: true});
+            window.scrollTo(0, document.body.scrollHeight);
+            quiet = setTimeout(finish, quietMs);
+            hard = setTimeout(finish, maxMs);
+        """, SCROLL_QUIET_MS, int(max_wait_s * 1000))
+        log(f"Scroll completado: {total} contenedores cargados")
+    except Exception as e:
+        log(f"⚠️  Error esperando carga por DOM, uso scroll por sondeo: {e}")
+        _full_scroll_polling(driver)
+    finally:
+        try:
+            driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        except Exception:
+            pass
+        # El driver es compartido: los execute_async_script posteriores no heredan el límite del scroll
+        try:
+            driver.set_script_timeout(previous_script_timeout)
+        except Exception:
+            pass
+
+def _get_events_html(driver):
+    """Devuelve solo el HTML de las tarjetas de eventos (fallback: página completa)"""
+    try:
+        html = driver.execute_script("""
+            return Array.from(document.querySelectorAll('div.group.mb-6'))
+                .map(el => el.outerHTML)
+                .join('');
+        """)
+        if html:
+            return html
+    except Exception as e:
+        log(f"⚠️  No se pudo extraer HTML parcial: {e}")
+    return driver.page_source
+
 # ============================== MÓDULO 1: EXTRACCIÓN DE EVENTOS ==============================
 
+def _walk_event_container(container):
+    """Recorre una sola vez el contenedor de un evento y devuelve los nodos de interés"""
+    nodes = {
+        'name': None,
+        'text_xs': [],
+        'club': None,
+        'flag': None,
+        'info_link': None,
+        'participants_link': None,
+    }
+    for node in container.descendants:
+        if not isinstance(node, Tag):
+            continue
+        
+        if node.name == 'div':
+            classes = node.get('class') or []
+            class_str = ' '.join(classes)
+            if nodes['name'] is None and class_str == 'font-caption text-lg text-black truncate -mt-1':
+                nodes['name'] = node
+            if 'text-xs' in classes:
+                nodes['text_xs'].append(node)
+                if nodes['club'] is None and class_str == 'text-xs mb-0.5 mt-0.5':
+                    nodes['club'] = node
+            if nodes['flag'] is None and 'text-md' in classes:
+                nodes['flag'] = node
+        
+        elif node.name == 'a':
+            href = node.get('href') or ''
+            if nodes['info_link'] is None and '/info/' in href:
+                nodes['info_link'] = node
+            if nodes['participants_link'] is None and ('/participants_list' in href or '/participantes' in href):
+                nodes['participants_link'] = node
+    
+    return nodes
+
 def extract_events():
     """Función principal para extraer eventos básicos"""
     if not HAS_SELENIUM:
@@ -457,36 +716,33 @@ def extract_events():
     log("=== MÓDULO 1: EXTRACCIÓN DE EVENTOS BÁSICOS ===")
     log(f"🔧 MODO PRUEBAS - SOLO {MAX_EVENTS_FOR_TESTING} PRIMEROS EVENTOS")
     
-    driver = _get_driver(headless=HEADLESS)
+    driver = _shared_driver()
     if not driver:
         log("❌ No se pudo crear el driver de Chrome")
         return None
     
     try:
-        if not _login(driver):
+        if not _ensure_login(driver):
             raise Exception("No se pudo iniciar sesión")
         
         # Navegar a eventos
         log("Navegando a la página de eventos...")
         driver.get(EVENTS_URL)
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        wait_for_selector(driver, EVENT_CARD_SELECTOR, timeout=30, log=log)
         
         # Aceptar cookies
         _accept_cookies(driver)
         
-        # Scroll completo para cargar todos los eventos
+        # Scroll completo para cargar todos los eventos (termina cuando deja de crecer)
         log("Cargando todos los eventos...")
         _full_scroll(driver)
-        slow_pause(2, 3)
         
-        # Obtener HTML de la página
-        page_html = driver.page_source
+        # Obtener solo el HTML de los contenedores de eventos
+        page_html = _get_events_html(driver)
         
         # Extraer eventos usando BeautifulSoup
         log("Extrayendo información de eventos...")
-        soup = BeautifulSoup(page_html, 'html.parser')
+        soup = BeautifulSoup(page_html, HTML_PARSER, parse_only=ONLY_EVENTS)
         
         # Buscar contenedores de eventos
         event_containers = soup.find_all('div', class_='group mb-6')
@@ -507,73 +763,70 @@ def extract_events():
                 if event_id:
                     event_data['id'] = event_id.replace('event-card-', '')
                 
+                # Un único recorrido del contenedor para localizar todos los nodos
+                nodes = _walk_event_container(container)
+                text_xs = nodes['text_xs']
+                
                 # Nombre del evento
-                name_elem = container.find('div', class_='font-caption text-lg text-black truncate -mt-1')
+                name_elem = nodes['name']
                 if name_elem:
-                    event_data['nombre'] = _clean(name_elem.get_text())
+                    event_data['nombre'] = clean(name_elem.get_text())
                 
                 # Fechas
-                date_elem = container.find('div', class_='text-xs')
-                if date_elem:
-                    event_data['fechas'] = _clean(date_elem.get_text())
+                if text_xs:
+                    event_data['fechas'] = clean(text_xs[0].get_text())
                 
                 # Organización
-                org_elems = container.find_all('div', class_='text-xs')
-                if len(org_elems) > 1:
-                    event_data['organizacion'] = _clean(org_elems[1].get_text())
+                if len(text_xs) > 1:
+                    event_data['organizacion'] = clean(text_xs[1].get_text())
                 
                 # Club organizador - BUSCAR ESPECÍFICAMENTE
-                club_elem = container.find('div', class_='text-xs mb-0.5 mt-0.5')
+                club_elem = nodes['club']
                 if club_elem:
-                    event_data['club'] = _clean(club_elem.get_text())
+                    event_data['club'] = clean(club_elem.get_text())
                 else:
                     # Fallback: buscar en todos los divs con text-xs
-                    for div in container.find_all('div', class_='text-xs'):
-                        text = _clean(div.get_text())
+                    for div in text_xs:
+                        text = clean(div.get_text())
                         if text and not any(x in text for x in ['/', 'Spain', 'España']):
                             event_data['club'] = text
                             break
                 
-                # Lugar - BUSCAR PATRÓN CIUDAD/PAÍS
-                location_divs = container.find_all('div', class_='text-xs')
-                for div in location_divs:
-                    text = _clean(div.get_text())
-                    if '/' in text and any(x in text for x in ['Spain', 'España', 'Madrid', 'Barcelona']):
+                # Lugar - PATRÓN CIUDAD/PAÍS o, si no hay, el primer texto corto con / (una sola pasada)
+                fallback_place = None
+                for div in text_xs:
+                    text = clean(div.get_text())
+                    if '/' not in text:
+                        continue
+                    if any(x in text for x in PLACE_MARKERS):
                         event_data['lugar'] = text
                         break
-                
-                # Si no encontramos lugar, buscar cualquier texto con /
-                if 'lugar' not in event_data:
-                    for div in location_divs:
-                        text = _clean(div.get_text())
-                        if '/' in text and len(text) < 100:  # Evitar textos muy largos
-                            event_data['lugar'] = text
-                            break
+                    if fallback_place is None and len(text) < 100:  # Evitar textos muy largos
+                        fallback_place = text
+                if 'lugar' not in event_data and fallback_place is not None:
+                    event_data['lugar'] = fallback_place
                 
                 # Enlaces
                 event_data['enlaces'] = {}
                 
                 # Enlace de información
-                info_link = container.find('a', href=lambda x: x and '/info/' in x)
+                info_link = nodes['info_link']
                 if info_link:
                     event_data['enlaces']['info'] = urljoin(BASE, info_link['href'])
                 
                 # Enlace de participantes - BUSCAR EXPLÍCITAMENTE
-                participant_links = container.find_all('a', href=lambda x: x and any(term in x for term in ['/participants', '/participantes']))
-                for link in participant_links:
-                    href = link.get('href', '')
-                    if '/participants_list' in href or '/participantes' in href:
-                        event_data['enlaces']['participantes'] = urljoin(BASE, href)
-                        break
+                participants_link = nodes['participants_link']
+                if participants_link:
+                    event_data['enlaces']['participantes'] = urljoin(BASE, participants_link['href'])
                 
                 # Si no encontramos el enlace de participantes, construirlo
                 if 'participantes' not in event_data['enlaces'] and 'id' in event_data:
                     event_data['enlaces']['participantes'] = f"{BASE}/zone/events/{event_data['id']}/participants_list"
                 
                 # Bandera del país
-                flag_elem = container.find('div', class_='text-md')
+                flag_elem = nodes['flag']
                 if flag_elem:
-                    event_data['pais_bandera'] = _clean(flag_elem.get_text())
+                    event_data['pais_bandera'] = clean(flag_elem.get_text())
                 else:
                     event_data['pais_bandera'] = '🇪🇸'  # Valor por defecto
                 
@@ -589,13 +842,10 @@ def extract_events():
         output_file = os.path.join(OUT_DIR, f'01events_{today_str}.json')
         os.makedirs(OUT_DIR, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
+        write_json(output_file, events)
         
-        # Crear también un archivo sin fecha para consistencia
-        latest_file = os.path.join(OUT_DIR, '01events.json')
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
+        # Crear también un archivo sin fecha para consistencia (copia, sin re-serializar)
+        shutil.copyfile(output_file, os.path.join(OUT_DIR, '01events.json'))
         
         log(f"✅ Extracción completada. {len(events)} eventos guardados en {output_file}")
         
@@ -616,28 +866,23 @@ def extract_events():
         log(f"❌ Error durante el scraping: {str(e)}")
         traceback.print_exc()
         return None
-    finally:
-        try:
-            driver.quit()
-            log("Navegador cerrado")
-        except:
-            pass
 
 # ============================== MÓDULO 2: INFORMACIÓN DETALLADA ==============================
 
 def _wait_liveview_ready(driver, hard_timeout=20):
     """Espera a que LiveView haya hidratado el DOM (html.phx-connected o [data-phx-root] poblado)."""
     try:
-        WebDriverWait(driver, hard_timeout).until(
-            lambda d: (
-                "phx-connected" in d.find_element(By.TAG_NAME, "html").get_attribute("class")
-            ) or d.find_elements(By.CSS_SELECTOR, "[data-phx-root]")
-        )
-        # pequeño extra para que pinte listas
-        time.sleep(1.0)
-        return True
-    except Exception:
+        WebDriverWait(driver, hard_timeout).until(lambda d: d.execute_script(LIVEVIEW_READY_JS))
+    except WebDriverException:  # incluye TimeoutException
         return False
+    # En lugar de una pausa fija, esperar (poco) a que pinten las filas de la lista
+    try:
+        WebDriverWait(driver, LIST_READY_S, poll_frequency=0.2).until(
+            lambda d: d.execute_script(LIST_PAINTED_JS, BOOKING_SELECTOR)
+        )
+    except TimeoutException:
+        pass
+    return True
 
 def _count_participants_liveview(driver, soft_scroll=True) -> int:
     """
@@ -653,87 +898,148 @@ def _count_participants_liveview(driver, soft_scroll=True) -> int:
             for _ in range(2):
                 driver.execute_script("window.scrollBy(0, document.body.scrollHeight/2);")
                 time.sleep(0.6)
-        except Exception:
+        except WebDriverException:
             pass
 
-    # 3) Métodos específicos para participants_list de FlowAgility
-    booking_selectors = [
-        "[phx-value-booking_id]",              # atributo estándar
-        "[data-phx-value-booking_id]",         # a veces data-*
-        '[phx-click="booking_details"]',       # botones que abren detalles
-        '[phx-click="booking_details_show"]',  # otro tipo de botón
-        "[data-phx-click*=booking_details]",   # variantes
-        '[id^="booking-"]',                    # ids como booking-12345
-        '[class*="participant"]',              # clases con participant
-        '[class*="competitor"]',               # clases con competitor
-    ]
+    # 3-6) Todo el DOM necesario en una sola llamada (sin un round-trip por elemento)
+    try:
+        bids, tables, participant_like_cards, body_txt = driver.execute_script(
+            PARTICIPANTS_SNAPSHOT_JS, BOOKING_SELECTOR, CARD_SELECTOR, list(PARTICIPANT_KEYWORDS)
+        )
+    except WebDriverException:
+        return 0
 
+    # 3) Métodos específicos para participants_list de FlowAgility
     booking_ids = set()
-    for sel in booking_selectors:
-        try:
-            nodes = driver.find_elements(By.CSS_SELECTOR, sel)
-            for el in nodes:
-                bid = (
-                    el.get_attribute("phx-value-booking_id")
-                    or el.get_attribute("data-phx-value-booking_id")
-                    or el.get_attribute("id")
-                    or ""
-                )
-                # Normaliza ids tipo "booking-12345" -> "12345"
-                m = re.search(r"(\d{3,})", bid or "")
-                if m:
-                    booking_ids.add(m.group(1))
-                elif bid and len(bid) > 5:  # Si tiene un ID significativo
-                    booking_ids.add(bid)
-        except Exception:
-            continue
+    for bid in bids or []:
+        # Normaliza ids tipo "booking-12345" -> "12345"
+        m = BOOKING_NUM_RE.search(bid or "")
+        if m:
+            booking_ids.add(m.group(1))
+        elif bid and len(bid) > 5:  # Si tiene un ID significativo
+            booking_ids.add(bid)
 
     if booking_ids:
         return len(booking_ids)
 
     # 4) Fallback: contar filas de tablas
-    try:
-        tables = driver.find_elements(By.TAG_NAME, "table")
-        for t in tables:
-            rows = t.find_elements(By.TAG_NAME, "tr")
-            if len(rows) > 1:
-                header_text = rows[0].text.lower()
-                if any(k in header_text for k in ["dorsal", "guía", "guia", "perro", "nombre", "participant"]):
-                    return max(0, len(rows) - 1)
-                # si no hay cabecera clara, pero hay muchas filas razonables
-                if 5 <= len(rows) <= 500:
-                    return len(rows) - 1
-    except Exception:
-        pass
+    for n_rows, header_text in tables or []:
+        if n_rows > 1:
+            header_text = (header_text or "").lower()
+            if any(k in header_text for k in ["dorsal", "guía", "guia", "perro", "nombre", "participant"]):
+                return max(0, n_rows - 1)
+            # si no hay cabecera clara, pero hay muchas filas razonables
+            if 5 <= n_rows <= 500:
+                return n_rows - 1
 
-    # 5) Buscar elementos que parezcan tarjetas de participantes
-    try:
-        cards = driver.find_elements(By.CSS_SELECTOR, "div[class*='card'], div[class*='item'], div[class*='row']")
-        participant_like_cards = 0
-        for card in cards:
-            text = card.text.lower()
-            if any(keyword in text for keyword in ['dorsal', 'guía', 'guia', 'perro', 'booking']):
-                participant_like_cards += 1
-        
-        if participant_like_cards > 0:
-            return participant_like_cards
-    except Exception:
-        pass
+    # 5) Elementos que parecen tarjetas de participantes
+    if participant_like_cards:
+        return int(participant_like_cards)
 
     # 6) Último recurso: buscar en texto
-    try:
-        body_txt = driver.find_element(By.TAG_NAME, "body").text.lower()
-        for pat in [r'(\d+)\s*participantes?', r'(\d+)\s*inscritos?', r'(\d+)\s*competidores?', r'total:\s*(\d+)']:
-            m = re.search(pat, body_txt)
-            if m:
-                n = int(m.group(1))
-                if 0 <= n <= 2000:
-                    return n
-    except Exception:
-        pass
+    body_txt = (body_txt or "").lower()
+    for literal, pat in PARTICIPANT_COUNT_RES:
+        if literal not in body_txt:
+            continue
+        m = pat.search(body_txt)
+        if m:
+            n = int(m.group(1))
+            if 0 <= n <= 2000:
+                return n
 
     return 0
 
+def _http_session_from_driver(driver):
+    """Sesión requests con las cookies del driver ya autenticado (None si no aplica)."""
+    if not (HTTP_PARTICIPANTS and HAS_REQUESTS):
+        return None
+    try:
+        session = requests.Session()
+        # Conexiones keep-alive suficientes para las descargas en paralelo de cada lote
+        adapter = HTTPAdapter(pool_connections=HTTP_WORKERS, pool_maxsize=HTTP_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": driver.execute_script("return navigator.userAgent")})
+        for c in driver.get_cookies():
+            session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path', '/'))
+        return session
+    except Exception as e:
+        log(f"⚠️  No se pudo preparar la sesión HTTP: {e}")
+        return None
+
+def _count_participants_soup(soup):
+    """Conteo de booking ids sobre HTML ya parseado (mismas reglas que en el DOM vivo)."""
+    booking_ids = set()
+    for el in soup.select(BOOKING_SELECTOR):
+        bid = el.get("phx-value-booking_id") or el.get("data-phx-value-booking_id") or el.get("id") or ""
+        m = BOOKING_NUM_RE.search(bid)
+        if m:
+            booking_ids.add(m.group(1))
+        elif len(bid) > 5:
+            booking_ids.add(bid)
+    return len(booking_ids)
+
+def _fetch_one_participants_http(session, ev):
+    """(html, n) de la página de participantes de un evento, o None si el render inicial no trae filas."""
+    url = (ev.get('enlaces') or {}).get('participantes')
+    if not url:
+        return None
+    try:
+        r = session.get(url, timeout=20)
+    except requests.RequestException as e:
+        log(f"⚠️  Error HTTP en {url}: {e}")
+        return None
+    if r.status_code != 200 or "/user/login" in r.url:
+        return None
+    n = _count_participants_soup(BeautifulSoup(r.text, HTML_PARSER))
+    return (r.text, n) if n > 0 else None
+
+def _fetch_participants_http(session, events):
+    """
+    Descarga por HTTP (en paralelo) las páginas de participantes de un lote.
+    Devuelve {id(evento): (html, n)} solo para las que ya traen filas en el render inicial.
+    """
+    if not session or not events:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(HTTP_WORKERS, len(events)))) as pool:
+        results = pool.map(lambda ev: _fetch_one_participants_http(session, ev), events)
+        return {id(ev): res for ev, res in zip(events, results) if res}
+
+def _prefetch_in_tabs(driver, events):
+    """Abre una pestaña por evento y lanza su navegación; devuelve {id(evento): handle}.
+
+    window.open no espera a que cargue la página (driver.get sí), así que todas las
+    pestañas del lote cargan a la vez mientras el driver sigue en la principal.
+    """
+    main_handle = driver.current_window_handle
+    tabs = {}
+    for ev in events:
+        url = (ev.get('enlaces') or {}).get('participantes')
+        if not url:
+            continue
+        try:
+            before = set(driver.window_handles)
+            driver.execute_script("window.open(arguments[0], '_blank');", url)
+            new_handles = set(driver.window_handles) - before
+            if new_handles:
+                tabs[id(ev)] = new_handles.pop()
+            else:
+                log(f"⚠️  No se abrió pestaña para {url}")
+        except WebDriverException as e:
+            log(f"⚠️  No se pudo precargar {url} en otra pestaña: {e}")
+    driver.switch_to.window(main_handle)
+    return tabs
+
+def _close_tabs(driver, tabs, main_handle):
+    """Cierra las pestañas de un lote y vuelve a la principal."""
+    for handle in tabs.values():
+        try:
+            driver.switch_to.window(handle)
+            driver.close()
+        except WebDriverException:
+            pass
+    driver.switch_to.window(main_handle)
+
 def extract_detailed_info():
     """Extraer información detallada de cada evento incluyendo número de participantes"""
     if not HAS_SELENIUM:
@@ -744,16 +1050,13 @@ def extract_detailed_info():
     log(f"🔧 MODO PRUEBAS - SOLO {MAX_EVENTS_FOR_TESTING} PRIMEROS EVENTOS")
     
     # Buscar el archivo de eventos más reciente
-    event_files = glob(os.path.join(OUT_DIR, "01events_*.json"))
-    if not event_files:
+    latest_event_file = latest_events_file(OUT_DIR)
+    if not latest_event_file:
         log("❌ No se encontraron archivos de eventos")
         return None
-    
-    latest_event_file = max(event_files, key=os.path.getctime)
-    
+
     # Cargar eventos
-    with open(latest_event_file, 'r', encoding='utf-8') as f:
-        events = json.load(f)
+    events = read_json(latest_event_file)
     
     log(f"✅ Cargados {len(events)} eventos desde {latest_event_file}")
     
@@ -761,18 +1064,29 @@ def extract_detailed_info():
     events = events[:MAX_EVENTS_FOR_TESTING]
     log(f"🔧 MODO PRUEBAS: Procesando solo {len(events)} eventos")
     
-    driver = _get_driver(headless=HEADLESS)
+    driver = _shared_driver()
     if not driver:
         log("❌ No se pudo crear el driver de Chrome")
         return None
     
     try:
-        if not _login(driver):
+        if not _ensure_login(driver):
             raise Exception("No se pudo iniciar sesión")
         
         detailed_events = []
+        main_handle = driver.current_window_handle
+        tabs = {}
+        http_pages = {}
+        session = _http_session_from_driver(driver)
+        batch_size = max(1, MAX_TABS)
         
         for i, event in enumerate(events, 1):
+            # Al empezar cada lote: primero HTTP; lo que no salga se precarga en pestañas
+            if (i - 1) % batch_size == 0:
+                batch = events[i - 1:i - 1 + batch_size]
+                http_pages = _fetch_participants_http(session, batch)
+                if MAX_TABS > 1:
+                    tabs = _prefetch_in_tabs(driver, [ev for ev in batch if id(ev) not in http_pages])
             try:
                 # PRESERVAR CAMPOS ORIGINALES IMPORTANTES
                 preserved_fields = ['id', 'nombre', 'fechas', 'organizacion', 'club', 'lugar', 'enlaces', 'pais_bandera']
@@ -790,20 +1104,28 @@ def extract_detailed_info():
                     log(f"  URL participantes: {participants_url}")
 
                     try:
-                        # Navegar a la página de participantes
-                        driver.get(participants_url)
-                        WebDriverWait(driver, 30).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-                        
-                        # Esperar a que LiveView esté listo
-                        _wait_liveview_ready(driver, hard_timeout=25)
-                        
-                        slow_pause(2, 3)
-                        
-                        # Obtener HTML de la página
-                        page_html = driver.page_source
-                        soup = BeautifulSoup(page_html, 'html.parser')
+                        http_count = None
+                        if id(event) in http_pages:
+                            # El render inicial por HTTP ya trae las filas: sin navegador
+                            page_html, http_count = http_pages[id(event)]
+                            log("  ⚡ Participantes obtenidos por HTTP")
+                        else:
+                            # Ir a su pestaña ya cargándose (o navegar si no se abrió)
+                            handle = tabs.get(id(event))
+                            if handle:
+                                driver.switch_to.window(handle)
+                            else:
+                                driver.get(participants_url)
+                            WebDriverWait(driver, 30).until(
+                                EC.presence_of_element_located((By.TAG_NAME, "body"))
+                            )
+                            
+                            # Esperar a que LiveView esté listo (y sus filas pintadas)
+                            _wait_liveview_ready(driver, hard_timeout=25)
+                            
+                            # Obtener HTML de la página
+                            page_html = driver.page_source
+                        soup = BeautifulSoup(page_html, HTML_PARSER)
                         
                         # ===== EXTRAER INFORMACIÓN ADICIONAL DE LA PÁGINA DE PARTICIPANTES =====
                         additional_info = {}
@@ -811,7 +1133,7 @@ def extract_detailed_info():
                         # Extraer título de la página
                         title_elem = soup.find('h1') or soup.find('title')
                         if title_elem:
-                            additional_info['titulo_pagina'] = _clean(title_elem.get_text())
+                            additional_info['titulo_pagina'] = clean(title_elem.get_text())
                         
                         # Intentar extraer información del evento desde la página de participantes
                         # Buscar información en headers o elementos específicos
@@ -823,51 +1145,43 @@ def extract_detailed_info():
                         ]
                         
                         for selector in header_selectors:
+                            if 'titulo' in additional_info:
+                                break  # campo ya resuelto: no seguir recorriendo selectores
                             try:
                                 elements = soup.select(selector)
                                 for elem in elements:
-                                    text = _clean(elem.get_text())
+                                    text = clean(elem.get_text())
                                     if text and len(text) > 10 and 'flowagility' not in text.lower():
-                                        if 'titulo' not in additional_info:
-                                            additional_info['titulo'] = text
+                                        additional_info['titulo'] = text
                                         break
                             except:
                                 continue
                         
                         # Buscar información de fechas en la página de participantes
-                        date_patterns = [
-                            r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-                            r'\d{1,2}\s+(?:ene|feb|mar|abr|may|jun|jul|ago|sep|oct|nov|dic)\w*\s+\d{4}',
-                            r'\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{4}'
-                        ]
-                        
                         all_text = soup.get_text()
-                        for pattern in date_patterns:
-                            matches = re.findall(pattern, all_text, re.IGNORECASE)
+                        for pattern in DATE_RES:
+                            matches = pattern.findall(all_text)
                             if matches:
                                 additional_info['fechas_detectadas'] = matches
                                 break
                         
-                        # Buscar información de ubicación
-                        location_indicators = ['lugar', 'ubicacion', 'location', 'place', 'ciudad', 'city']
-                        for indicator in location_indicators:
-                            if indicator in all_text.lower():
-                                # Buscar texto alrededor del indicador
-                                lines = all_text.split('\n')
-                                for line in lines:
-                                    if indicator in line.lower():
-                                        additional_info['ubicacion_detectada'] = _clean(line)
-                                        break
-                                break
+                        # Buscar información de ubicación: primer indicador presente y su primera línea
+                        all_text_lower = all_text.lower()
+                        indicator = next((ind for ind in LOCATION_INDICATORS if ind in all_text_lower), None)
+                        if indicator:
+                            for line in all_text.split('\n'):
+                                if indicator in line.lower():
+                                    additional_info['ubicacion_detectada'] = clean(line)
+                                    break
                         
                         # ===== CONTAR PARTICIPANTES =====
-                        num_participants = _count_participants_liveview(driver)
+                        num_participants = http_count if http_count is not None else _count_participants_liveview(driver)
 
                         if num_participants > 0:
                             detailed_event['numero_participantes'] = num_participants
                             detailed_event['participantes_info'] = f"{num_participants} participantes"
                             additional_info['estado_participantes'] = f"Encontrados {num_participants} participantes"
-                            log(f"  ✅ Encontrados {num_participantes} participantes")
+                            log(f"  ✅ Encontrados {num_participants} participantes")
                         else:
                             detailed_event['numero_participantes'] = 0
                             detailed_event['participantes_info'] = 'Sin participantes'
@@ -882,29 +1196,26 @@ def extract_detailed_info():
                             # Extraer nombres de participantes si es posible
                             participant_names = []
                             
-                            # Buscar elementos que puedan contener nombres de participantes
-                            name_selectors = [
-                                '[class*="participant"]',
-                                '[class*="competitor"]',
-                                '[class*="name"]',
-                                '[class*="guia"]',
-                                '[class*="guide"]'
-                            ]
-                            
-                            for selector in name_selectors:
-                                elements = soup.select(selector)
-                                for elem in elements:
-                                    text = _clean(elem.get_text())
+                            # Elementos que puedan contener nombres, selector a selector;
+                            # se para al llegar a los que se guardan
+                            for selector in NAME_SELECTORS:
+                                for elem in soup.select(selector):
+                                    text = clean(elem.get_text())
                                     if text and len(text) > 2 and len(text) < 100:
                                         # Filtrar textos que parecen nombres reales
-                                        if any(word in text.lower() for word in ['participant', 'competitor', 'name', 'nombre']):
+                                        text_lower = text.lower()
+                                        if any(word in text_lower for word in NAME_LABEL_WORDS):
                                             continue
-                                        if re.search(r'[a-zA-ZáéíóúÁÉÍÓÚñÑ]', text):
+                                        if HAS_LETTER_RE.search(text):
                                             participant_names.append(text)
+                                            if len(participant_names) >= MAX_PARTICIPANT_NAMES:
+                                                break
+                                if len(participant_names) >= MAX_PARTICIPANT_NAMES:
+                                    break
                             
-                            # Limitar y guardar nombres de participantes
+                            # Guardar nombres de participantes (solo los primeros)
                             if participant_names:
-                                detailed_event['informacion_adicional']['primeros_participantes'] = participant_names[:5]  # Solo primeros 5
+                                detailed_event['informacion_adicional']['primeros_participantes'] = participant_names
                         
                         except Exception as e:
                             log(f"  ⚠️  Error extrayendo detalles de participantes: {e}")
@@ -933,19 +1244,20 @@ def extract_detailed_info():
                 event['participantes_info'] = f"Error: {str(e)}"
                 event['informacion_adicional'] = {'error': str(e)}
                 detailed_events.append(event)
-                continue
+            
+            # Fin del lote: cerrar sus pestañas y volver a la principal
+            if tabs and (i % MAX_TABS == 0 or i == len(events)):
+                _close_tabs(driver, tabs, main_handle)
+                tabs = {}
         
         # Guardar información detallada
         today_str = datetime.now().strftime("%Y-%m-%d")
         output_file = os.path.join(OUT_DIR, f'02info_{today_str}.json')
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(detailed_events, f, ensure_ascii=False, indent=2)
+        write_json(output_file, detailed_events)
         
-        # Crear también un archivo sin fecha para consistencia
-        latest_file = os.path.join(OUT_DIR, '02info.json')
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(detailed_events, f, ensure_ascii=False, indent=2)
+        # Crear también un archivo sin fecha para consistencia (copia, sin re-serializar)
+        shutil.copyfile(output_file, os.path.join(OUT_DIR, '02info.json'))
         
         log(f"✅ Información detallada guardada en {output_file}")
         
@@ -976,11 +1288,6 @@ def extract_detailed_info():
         log(f"❌ Error durante la extracción detallada: {str(e)}")
         traceback.print_exc()
         return None
-    finally:
-        try:
-            driver.quit()
-        except:
-            pass
 
 # ============================== FUNCIÓN PRINCIPAL ==============================
 
@@ -992,21 +1299,20 @@ def main():
     print(f"🔧 MODO PRUEBAS: Procesando solo {MAX_EVENTS_FOR_TESTING} eventos")
     print("=" * 80)
     
+    # Primero la CLI: --help o un --module inválido salen sin tocar OUT_DIR
+    module = parse_module(sys.argv[1:])
+    
     # Crear directorio de output
     os.makedirs(OUT_DIR, exist_ok=True)
     
     # Limpiar archivos antiguos
     _clean_output_directory()
     
-    parser = argparse.ArgumentParser(description="FlowAgility Scraper - Eventos e Info Detallada")
-    parser.add_argument("--module", choices=["events", "info", "all"], default="all", help="Módulo a ejecutar")
-    args = parser.parse_args()
-    
     try:
         success = True
         
         # Módulo 1: Eventos básicos
-        if args.module in ["events", "all"]:
+        if module in ["events", "all"]:
             log("🏁 INICIANDO EXTRACCIÓN DE EVENTOS BÁSICOS")
             events = extract_events()
             if not events:
@@ -1016,7 +1322,7 @@ def main():
                 log("✅ Eventos básicos extraídos correctamente")
         
         # Módulo 2: Información detallada
-        if args.module in ["info", "all"] and success:
+        if module in ["info", "all"] and success:
             log("🏁 INICIANDO EXTRACCIÓN DE INFORMACIÓN DETALLADA")
             detailed_events = extract_detailed_info()
             if not detailed_events:
@@ -1029,11 +1335,10 @@ def main():
             
             # Mostrar solo archivos nuevos generados
             print(f"\n📁 ARCHIVOS GENERADOS EN {OUT_DIR}:")
-            output_files = glob(os.path.join(OUT_DIR, "*"))
-            for file in sorted(output_files):
-                if os.path.isfile(file):
-                    size = os.path.getsize(file)
-                    print(f"   {os.path.basename(file)} - {size} bytes")
+            with os.scandir(OUT_DIR) as it:
+                output_files = sorted((e.name, e.stat().st_size) for e in it if e.is_file())
+            for name, size in output_files:
+                print(f"   {name} - {size} bytes")
                     
         else:
             log("❌ PROCESO COMPLETADO CON ERRORES")
@@ -1044,6 +1349,8 @@ def main():
         log(f"❌ ERROR CRÍTICO DURANTE LA EJECUCIÓN: {e}")
         traceback.print_exc()
         return False
+    finally:
+        _close_shared_driver()
 
 if __name__ == "__main__":
     success = main()
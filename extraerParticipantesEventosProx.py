@@ -41,6 +41,8 @@ principales que se ejecutan secuencialmente:
 • 01events.json                  → Eventos básicos (siempre actual)
 • 02info_YYYY-MM-DD.json         → Info detallada + participantes (con fecha)
 • 02info.json                    → Info detallada (siempre actual)
+• summary.json                   → Resumen estadístico (para --resume)
+• events.jsonl                   → Info detallada, un evento por línea (streaming)
 
 ⚙️  CONFIGURACIÓN:
 • Credenciales mediante variables de entorno (.env)
@@ -123,6 +125,8 @@ principales que se ejecutan secuencialmente:
 • 01events.json                  → Eventos básicos (siempre actual)
 • 02info_YYYY-MM-DD.json         → Info detallada + participantes (con fecha)
 • 02info.json                    → Info detallada (siempre actual)
+• summary.json                   → Resumen estadístico (para --resume)
+• events.jsonl                   → Info detallada, un evento por línea (streaming)
 
 ⚙️  CONFIGURACIÓN:
 • Credenciales mediante variables de entorno (.env)
@@ -167,21 +171,26 @@ python flowagility_scraper.py [--module events|info|all]
 
 import os
 import sys
-import json
 import re
 import time
 import argparse
 import traceback
-import unicodedata
 import random
+import heapq
+import collections
+import shutil
+import textwrap
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime
 from urllib.parse import urljoin
 from pathlib import Path
-from glob import glob
 
 # Third-party imports
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
     from dotenv import load_dotenv
 except ImportError as e:
     print(f"❌ Error importando dependencias: {e}")
@@ -207,6 +216,23 @@ try:
 except ImportError:
     HAS_WEBDRIVER_MANAGER = False
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+# Utilidades compartidas por los tres scrapers (texto, JSON, ficheros de salida y esperas)
+from utilidadesEventosProx import (BLOCKED_URL_PATTERNS, clean, dumps, latest_events_file,
+                                   read_json, wait_for_selector, write_json)
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # ============================== CONFIGURACIÓN GLOBAL ==============================
 
 # Configuración base
@@ -231,6 +257,60 @@ INCOGNITO = os.getenv("INCOGNITO", "true").lower() == "true"
 MAX_SCROLLS = int(os.getenv("MAX_SCROLLS", "15"))
 SCROLL_WAIT_S = float(os.getenv("SCROLL_WAIT_S", "3.0"))
 OUT_DIR = os.getenv("OUT_DIR", "./output")
+# Trazas completas solo en depuración (--debug o DEBUG=true)
+DEBUG = "--debug" in sys.argv or os.getenv("DEBUG", "false").lower() == "true"
+DETAIL_WORKERS = int(os.getenv("DETAIL_WORKERS", "4"))
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+SUMMARY_FILE = "summary.json"
+EVENTS_JSONL_FILE = "events.jsonl"
+STATIC_EVENTS = os.getenv("STATIC_EVENTS", "true").lower() == "true"
+# Páginas de info/participantes por HTTP con las cookies del login (Selenium solo como respaldo)
+HTTP_PAGES = os.getenv("HTTP_PAGES", "true").lower() == "true"
+BLOCK_ASSETS = os.getenv("BLOCK_ASSETS", "true").lower() == "true"
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager")  # driver.get() vuelve en DOMContentLoaded
+# Parser de BeautifulSoup: lxml (C) es bastante más rápido que html.parser
+HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+# Al parsear la lista de eventos solo se construyen las tarjetas (y su contenido)
+ONLY_EVENTS = SoupStrainer('div', attrs={'class': 'group mb-6'})
+# Primera tarjeta de evento: indica que el listado ya está pintado
+EVENT_CARD_SELECTOR = "div.group.mb-6"
+# Textos que delatan un lugar "ciudad / país" en la tarjeta de evento
+PLACE_MARKERS = ('Spain', 'España', 'Madrid', 'Barcelona')
+# Clases exactas de los divs de la tarjeta, precalculadas como tuplas para comparar sin unir cadenas
+NAME_CLASSES = tuple('font-caption text-lg text-black truncate -mt-1'.split())
+CLUB_CLASSES = tuple('text-xs mb-0.5 mt-0.5'.split())
+CHROME_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Plantilla del ranking de eventos (los campos ausentes se muestran como N/A)
+_TOP_EVENT_TPL = "  {nombre}: {numero_participantes} participantes"
+_MISSING = collections.defaultdict(lambda: "N/A")
+
+# Patrones y selectores reutilizados en cada evento (compilados una sola vez)
+NEWLINES_RE = re.compile(r'\n+')
+DESCRIPTION_SELECTORS = (
+    'div[class*="description"]',
+    'div[class*="descripcion"]',
+    'div[class*="info"]',
+    'div[class*="content"]',
+    'div[class*="text"]',
+    'div[class*="body"]'
+)
+PRESERVED_FIELDS = ('id', 'nombre', 'fechas', 'organizacion', 'club', 'lugar', 'enlaces', 'pais_bandera')
+# Elementos que indican que cada página de detalle ya está renderizada
+INFO_READY_SELECTOR = "h1"
+PARTICIPANTS_READY_SELECTOR = "table tbody tr, [class*='participant'], [class*='competitor']"
+# Marcas en el HTML servido que indican que la respuesta HTTP ya trae el contenido útil
+# (en participantes, atributos de las filas de inscripción; "booking" suelto aparece en menús y scripts)
+INFO_READY_MARKERS = ("<h1",)
+PARTICIPANTS_READY_MARKERS = ('phx-value-booking_id', 'id="booking-')
+# Filas de inscripción en participants_list: cada una lleva su booking id (a veces en varios nodos)
+BOOKING_SELECTOR = "[phx-value-booking_id], [data-phx-value-booking_id], [id^='booking-']"
+BOOKING_NUM_RE = re.compile(r"(\d{3,})")
+CLUB_KEYWORDS = ('club', 'organizador', 'organizer')
+LOCATION_KEYWORDS = ('lugar', 'ubicacion', 'location', 'place')
+
+# Ranking de eventos en el resumen: solo en terminal salvo --verbose/--quiet
+SHOW_TOP_EVENTS = sys.stdout.isatty()
 
 print(f"📋 Configuración: HEADLESS={HEADLESS}, OUT_DIR={OUT_DIR}")
 
@@ -244,27 +324,25 @@ def slow_pause(min_s=1, max_s=2):
     """Pausa aleatoria"""
     time.sleep(random.uniform(min_s, max_s))
 
-def _clean(s: str) -> str:
-    """Limpia y normaliza texto"""
-    if not s:
-        return ""
-    s = str(s)
-    s = unicodedata.normalize("NFKC", s)
-    s = re.sub(r"[ \t]+", " ", s)
-    return s.strip(" \t\r\n-•*·:;")
-
 def _clean_output_directory():
     """Limpiar archivos antiguos del directorio de output"""
     try:
         # Mantener solo los archivos esenciales o eliminar todos los antiguos
         files_to_keep = ['config.json', 'settings.ini']  # Archivos de configuración a mantener
         
-        for file in os.listdir(OUT_DIR):
-            if file not in files_to_keep:
-                file_path = os.path.join(OUT_DIR, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                    log(f"🧹 Eliminado archivo antiguo: {file}")
+        with os.scandir(OUT_DIR) as it:
+            paths = [e.path for e in it if e.is_file() and e.name not in files_to_keep]
+        
+        def _remove(path):
+            try:
+                os.remove(path)
+                log(f"🧹 Eliminado archivo antiguo: {os.path.basename(path)}")
+            except OSError as e:
+                log(f"⚠️  No se pudo eliminar {os.path.basename(path)}: {e}")
+        
+        # Borrado en paralelo: cada unlink espera al sistema de ficheros
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_remove, paths))
         
         log("✅ Directorio de output limpiado")
     except Exception as e:
@@ -290,7 +368,7 @@ def _get_driver(headless=True):
     opts.add_argument("--disable-setuid-sandbox")
     opts.add_argument("--ignore-certificate-errors")
     opts.add_argument("--window-size=1920,1080")
-    opts.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    opts.add_argument(f"--user-agent={CHROME_UA}")
     
     if headless:
         opts.add_argument("--headless=new")
@@ -300,6 +378,15 @@ def _get_driver(headless=True):
     # Configuración adicional para evitar detección
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option('useAutomationExtension', False)
+    opts.page_load_strategy = PAGE_LOAD_STRATEGY
+    
+    # Sin imágenes ni notificaciones: solo necesitamos el texto de las páginas
+    if BLOCK_ASSETS:
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        opts.add_argument("--blink-settings=imagesEnabled=false")
     
     try:
         # USAR CHROME Y CHROMEDRIVER INSTALADOS CORRECTAMENTE
@@ -328,15 +415,24 @@ def _get_driver(headless=True):
         # Ejecutar script para evitar detección
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Bloquear CSS y fuentes (y cualquier imagen residual) a nivel de red
+        if BLOCK_ASSETS:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                log(f"No se pudo bloquear recursos vía CDP: {e}")
+        
         driver.set_page_load_timeout(90)
-        driver.implicitly_wait(30)
+        # Sin espera implícita: las esperas son explícitas (WebDriverWait / _wait_for_selector)
+        # y una implícita alta alarga cada sondeo fallido de find_elements
+        driver.implicitly_wait(0)
         return driver
         
     except Exception as e:
-        log(f"Error creando driver: {e}")
-        log("Traceback completo:")
-        import traceback
-        traceback.print_exc()
+        log(f"Error creando driver: {e.__class__.__name__}: {e!r}")
+        if DEBUG:
+            traceback.print_exc()
         return None
 
 def _login(driver):
@@ -456,19 +552,68 @@ def _login(driver):
                 
         except TimeoutException:
             log("❌ Timeout esperando redirección de login")
-            # Tomar screenshot para debugging
-            try:
-                driver.save_screenshot("/tmp/login_timeout.png")
-                log("📸 Screenshot guardado en /tmp/login_timeout.png")
-            except:
-                pass
+            # Screenshot solo en depuración
+            if DEBUG:
+                try:
+                    driver.save_screenshot("/tmp/login_timeout.png")
+                    log("📸 Screenshot guardado en /tmp/login_timeout.png")
+                except:
+                    pass
             return False
         
     except Exception as e:
-        log(f"❌ Error en login: {e}")
-        log(f"Traceback: {traceback.format_exc()}")
+        log(f"❌ Error en login: {e.__class__.__name__}: {e!r}")
+        if DEBUG:
+            log(f"Traceback: {traceback.format_exc()}")
         return False
 
+# Pool de drivers ya autenticados, compartido por todos los módulos
+_DRIVER_POOL = queue.Queue()
+
+def _checkout_driver():
+    """Toma un driver autenticado del pool o crea uno nuevo si está vacío"""
+    try:
+        return _DRIVER_POOL.get_nowait()
+    except queue.Empty:
+        pass
+    
+    driver = _get_driver(headless=HEADLESS)
+    if not driver:
+        return None
+    if not _login(driver):
+        try:
+            driver.quit()
+        except:
+            pass
+        return None
+    return driver
+
+def _checkin_driver(driver):
+    """Devuelve un driver al pool para reutilizarlo"""
+    if driver:
+        _DRIVER_POOL.put(driver)
+
+def _warm_driver_pool(size):
+    """Crea y autentica por adelantado hasta `size` drivers"""
+    for _ in range(max(0, size - _DRIVER_POOL.qsize())):
+        driver = _checkout_driver()
+        if not driver:
+            break
+        _checkin_driver(driver)
+
+def _drain_driver_pool():
+    """Cierra todos los drivers del pool"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except:
+            pass
+    log("Navegadores cerrados")
+
 def _accept_cookies(driver):
     """Aceptar cookies si es necesario"""
     try:
@@ -520,47 +665,93 @@ def _full_scroll(driver):
 
 # ============================== MÓDULO 1: EXTRACCIÓN DE EVENTOS ==============================
 
-def extract_events():
-    """Función principal para extraer eventos básicos"""
+def _fetch_events_static(url):
+    """Intenta obtener las tarjetas de eventos por HTTP simple, sin navegador"""
+    if not (STATIC_EVENTS and HAS_REQUESTS):
+        return []
+    
+    try:
+        response = requests.get(url, headers={'User-Agent': CHROME_UA}, timeout=20)
+        if response.status_code != 200 or 'group mb-6' not in response.text:
+            log("ℹ️  La página de eventos requiere navegador; uso Selenium")
+            return []
+        
+        soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=ONLY_EVENTS)
+        event_containers = soup.find_all('div', class_='group mb-6')
+        if event_containers:
+            log("⚡ Eventos obtenidos por HTTP sin navegador")
+        return event_containers
+    except requests.RequestException as e:
+        log(f"⚠️  Error en descarga estática de eventos: {e}")
+        return []
+
+def _walk_event_card(container):
+    """Recorre una sola vez la tarjeta de un evento y devuelve los nodos de interés"""
+    name = club = flag = info_link = participants_link = None
+    xs_divs = []
+    for node in container.descendants:
+        if not isinstance(node, Tag):
+            continue
+        if node.name == 'div':
+            classes = tuple(node.get('class') or ())
+            if name is None and classes == NAME_CLASSES:
+                name = node
+            if 'text-xs' in classes:
+                xs_divs.append(node)
+                if club is None and classes == CLUB_CLASSES:
+                    club = node
+            if flag is None and 'text-md' in classes:
+                flag = node
+        elif node.name == 'a':
+            href = node.get('href') or ''
+            if info_link is None and '/info/' in href:
+                info_link = node
+            if participants_link is None and ('/participants_list' in href or '/participantes' in href):
+                participants_link = node
+    return name, xs_divs, club, flag, info_link, participants_link
+
+def extract_events(on_event=None):
+    """Función principal para extraer eventos básicos
+    
+    on_event(i, total, event), si se indica, recibe cada evento en cuanto se extrae.
+    """
     if not HAS_SELENIUM:
         log("Error: Selenium no está instalado")
         return None
     
     log("=== MÓDULO 1: EXTRACCIÓN DE EVENTOS BÁSICOS ===")
     
-    driver = _get_driver(headless=HEADLESS)
-    if not driver:
-        log("❌ No se pudo crear el driver de Chrome")
-        return None
-    
+    driver = None
     try:
-        if not _login(driver):
-            raise Exception("No se pudo iniciar sesión")
-        
-        # Navegar a eventos
-        log("Navegando a la página de eventos...")
-        driver.get(EVENTS_URL)
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        # HTML estático primero; Selenium solo si no trae las tarjetas de eventos
+        event_containers = _fetch_events_static(EVENTS_URL)
+        if not event_containers:
+            driver = _checkout_driver()
+            if not driver:
+                log("❌ No se pudo obtener un driver de Chrome autenticado")
+                return None
+            
+            # Navegar a eventos
+            log("Navegando a la página de eventos...")
+            driver.get(EVENTS_URL)
+            wait_for_selector(driver, EVENT_CARD_SELECTOR, timeout=30, log=log)
         
-        # Aceptar cookies
-        _accept_cookies(driver)
+            # Aceptar cookies
+            _accept_cookies(driver)
         
-        # Scroll completo para cargar todos los eventos
-        log("Cargando todos los eventos...")
-        _full_scroll(driver)
-        slow_pause(2, 3)
+            # Scroll completo para cargar todos los eventos (termina cuando deja de crecer)
+            log("Cargando todos los eventos...")
+            _full_scroll(driver)
         
-        # Obtener HTML de la página
-        page_html = driver.page_source
+            # Obtener HTML de la página
+            page_html = driver.page_source
         
-        # Extraer eventos usando BeautifulSoup
-        log("Extrayendo información de eventos...")
-        soup = BeautifulSoup(page_html, 'html.parser')
+            # Extraer eventos usando BeautifulSoup
+            log("Extrayendo información de eventos...")
+            soup = BeautifulSoup(page_html, HTML_PARSER, parse_only=ONLY_EVENTS)
         
-        # Buscar contenedores de eventos
-        event_containers = soup.find_all('div', class_='group mb-6')
+            # Buscar contenedores de eventos
+            event_containers = soup.find_all('div', class_='group mb-6')
         log(f"Encontrados {len(event_containers)} contenedores de eventos")
         
         events = []
@@ -574,78 +765,72 @@ def extract_events():
                 if event_id:
                     event_data['id'] = event_id.replace('event-card-', '')
                 
+                # Todos los nodos de interés en un único recorrido de la tarjeta
+                name_elem, xs_divs, club_elem, flag_elem, info_link, participants_link = _walk_event_card(container)
+                
                 # Nombre del evento
-                name_elem = container.find('div', class_='font-caption text-lg text-black truncate -mt-1')
                 if name_elem:
-                    event_data['nombre'] = _clean(name_elem.get_text())
+                    event_data['nombre'] = clean(name_elem.get_text())
+                
+                # Textos de los divs text-xs: un solo clean por div
+                text_xs = [clean(div.get_text()) for div in xs_divs]
                 
                 # Fechas
-                date_elem = container.find('div', class_='text-xs')
-                if date_elem:
-                    event_data['fechas'] = _clean(date_elem.get_text())
+                if text_xs:
+                    event_data['fechas'] = text_xs[0]
                 
                 # Organización
-                org_elems = container.find_all('div', class_='text-xs')
-                if len(org_elems) > 1:
-                    event_data['organizacion'] = _clean(org_elems[1].get_text())
+                if len(text_xs) > 1:
+                    event_data['organizacion'] = text_xs[1]
                 
                 # Club organizador - BUSCAR ESPECÍFICAMENTE
-                club_elem = container.find('div', class_='text-xs mb-0.5 mt-0.5')
-                if club_elem:
-                    event_data['club'] = _clean(club_elem.get_text())
+                if club_elem is not None:
+                    event_data['club'] = text_xs[xs_divs.index(club_elem)]
                 else:
                     # Fallback: buscar en todos los divs con text-xs
-                    for div in container.find_all('div', class_='text-xs'):
-                        text = _clean(div.get_text())
+                    for text in text_xs:
                         if text and not any(x in text for x in ['/', 'Spain', 'España']):
                             event_data['club'] = text
                             break
                 
-                # Lugar - BUSCAR PATRÓN CIUDAD/PAÍS
-                location_divs = container.find_all('div', class_='text-xs')
-                for div in location_divs:
-                    text = _clean(div.get_text())
-                    if '/' in text and any(x in text for x in ['Spain', 'España', 'Madrid', 'Barcelona']):
+                # Lugar - PATRÓN CIUDAD/PAÍS o, si no hay, el primer texto corto con / (una sola pasada)
+                fallback_place = None
+                for text in text_xs:
+                    if '/' not in text:
+                        continue
+                    if any(x in text for x in PLACE_MARKERS):
                         event_data['lugar'] = text
                         break
-                
-                # Si no encontramos lugar, buscar cualquier texto con /
-                if 'lugar' not in event_data:
-                    for div in location_divs:
-                        text = _clean(div.get_text())
-                        if '/' in text and len(text) < 100:  # Evitar textos muy largos
-                            event_data['lugar'] = text
-                            break
+                    if fallback_place is None and len(text) < 100:  # Evitar textos muy largos
+                        fallback_place = text
+                if 'lugar' not in event_data and fallback_place is not None:
+                    event_data['lugar'] = fallback_place
                 
                 # Enlaces
                 event_data['enlaces'] = {}
                 
                 # Enlace de información
-                info_link = container.find('a', href=lambda x: x and '/info/' in x)
                 if info_link:
                     event_data['enlaces']['info'] = urljoin(BASE, info_link['href'])
                 
                 # Enlace de participantes - BUSCAR EXPLÍCITAMENTE
-                participant_links = container.find_all('a', href=lambda x: x and any(term in x for term in ['/participants', '/participantes']))
-                for link in participant_links:
-                    href = link.get('href', '')
-                    if '/participants_list' in href or '/participantes' in href:
-                        event_data['enlaces']['participantes'] = urljoin(BASE, href)
-                        break
+                if participants_link:
+                    event_data['enlaces']['participantes'] = urljoin(BASE, participants_link['href'])
                 
                 # Si no encontramos el enlace de participantes, construirlo
                 if 'participantes' not in event_data['enlaces'] and 'id' in event_data:
                     event_data['enlaces']['participantes'] = f"{BASE}/zone/events/{event_data['id']}/participants_list"
                 
                 # Bandera del país
-                flag_elem = container.find('div', class_='text-md')
                 if flag_elem:
-                    event_data['pais_bandera'] = _clean(flag_elem.get_text())
+                    event_data['pais_bandera'] = clean(flag_elem.get_text())
                 else:
                     event_data['pais_bandera'] = '🇪🇸'  # Valor por defecto
                 
                 events.append(event_data)
                 log(f"✅ Evento {i} procesado: {event_data.get('nombre', 'Sin nombre')}")
+                if on_event:
+                    on_event(i, len(event_containers), dict(event_data))
                 
             except Exception as e:
                 log(f"❌ Error procesando evento {i}: {str(e)}")
@@ -656,13 +841,10 @@ def extract_events():
         output_file = os.path.join(OUT_DIR, f'01events_{today_str}.json')
         os.makedirs(OUT_DIR, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
+        write_json(output_file, events)
         
-        # Crear también un archivo sin fecha para consistencia
-        latest_file = os.path.join(OUT_DIR, '01events.json')
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(events, f, ensure_ascii=False, indent=2)
+        # Crear también un archivo sin fecha para consistencia (copia, sin re-serializar)
+        shutil.copyfile(output_file, os.path.join(OUT_DIR, '01events.json'))
         
         log(f"✅ Extracción completada. {len(events)} eventos guardados en {output_file}")
         
@@ -680,39 +862,96 @@ def extract_events():
         return events
         
     except Exception as e:
-        log(f"❌ Error durante el scraping: {str(e)}")
-        traceback.print_exc()
+        log(f"❌ Error durante el scraping: {e.__class__.__name__}: {e!r}")
+        if DEBUG:
+            traceback.print_exc()
         return None
     finally:
-        try:
-            driver.quit()
-            log("Navegador cerrado")
-        except:
-            pass
+        _checkin_driver(driver)
 
 # ============================== MÓDULO 2: INFORMACIÓN DETALLADA ==============================
 
 import re
 
+# Un driver por hilo de trabajo (vuelven al pool al terminar el módulo)
+_thread_state = threading.local()
+_thread_drivers = []
+_drivers_lock = threading.Lock()
+
+# Sesión HTTP compartida por los hilos, con las cookies del primer driver autenticado
+_HTTP_SESSION = None
+_http_lock = threading.Lock()
+# Conexiones keep-alive del pool: tantas como hilos de detalle (se ajusta a --workers)
+_HTTP_POOL_SIZE = DETAIL_WORKERS
+
+def _http_session(driver):
+    """Sesión requests autenticada (keep-alive); None si HTTP_PAGES está desactivado o falta requests"""
+    global _HTTP_SESSION
+    if not (HTTP_PAGES and HAS_REQUESTS):
+        return None
+    with _http_lock:
+        if _HTTP_SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers['User-Agent'] = CHROME_UA
+            for c in driver.get_cookies():
+                session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path', '/'))
+            _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+def _set_http_pool_size(workers):
+    """Dimensiona el pool HTTP de la próxima sesión según los hilos reales"""
+    global _HTTP_POOL_SIZE
+    _HTTP_POOL_SIZE = max(1, workers)
+
+def _close_http_session():
+    global _HTTP_SESSION
+    with _http_lock:
+        if _HTTP_SESSION is not None:
+            _HTTP_SESSION.close()
+            _HTTP_SESSION = None
+
+def _page_html(driver, url, ready_selector, ready_markers):
+    """HTML de una página de detalle: GET autenticado y, si no trae el contenido, navegador"""
+    session = _http_session(driver)
+    if session:
+        try:
+            r = session.get(url, timeout=20)
+            if r.status_code == 200 and '/user/login' not in r.url and any(m in r.text for m in ready_markers):
+                return r.text
+        except requests.RequestException as e:
+            log(f"  ⚠️  Error HTTP en {url}, uso Selenium: {e.__class__.__name__}")
+    driver.get(url)
+    wait_for_selector(driver, ready_selector, log=log)
+    return driver.page_source
+
+def _count_participants_correctly(soup):
+    """Cuenta inscripciones por booking id único; si no hay ids, filas de la tabla de participantes"""
+    booking_ids = set()
+    for el in soup.select(BOOKING_SELECTOR):
+        bid = el.get("phx-value-booking_id") or el.get("data-phx-value-booking_id") or el.get("id") or ""
+        m = BOOKING_NUM_RE.search(bid)
+        if m:
+            booking_ids.add(m.group(1))
+        elif bid:
+            booking_ids.add(bid)
+    if booking_ids:
+        return len(booking_ids)
+    # Sin ids: filas del cuerpo de la tabla (la cabecera va en thead)
+    return len(soup.select("table tbody tr"))
+
 def _extract_description(soup, max_length=2000):
     """Extrae y limpia la descripción, limitando el tamaño"""
     try:
         # Buscar descripción en múltiples lugares
-        description_selectors = [
-            'div[class*="description"]',
-            'div[class*="descripcion"]',
-            'div[class*="info"]',
-            'div[class*="content"]',
-            'div[class*="text"]',
-            'div[class*="body"]'
-        ]
-
         description_text = ""
-        for selector in description_selectors:
+        for selector in DESCRIPTION_SELECTORS:
             try:
                 elem = soup.select_one(selector)
                 if elem:
-                    text = _clean(elem.get_text())
+                    text = clean(elem.get_text())
                     if text and len(text) > 50:  # Texto significativo
                         description_text = text
                         break
@@ -731,7 +970,7 @@ def _extract_description(soup, max_length=2000):
         # Unificar múltiples saltos de línea en uno solo
         if description_text:
             # El patrón r'\n+' busca uno o más caracteres de salto de línea consecutivos
-            description_text = re.sub(r'\n+', '\n', description_text)
+            description_text = NEWLINES_RE.sub('\n', description_text)
             # También puedes considerar limpiar espacios extra
             description_text = description_text.strip()
             
@@ -747,7 +986,273 @@ def _extract_description(soup, max_length=2000):
         log(f"Error extrayendo descripción: {e}")
         return ""
 
-def extract_detailed_info():
+def _scan_club_and_location(soup, want_club=True, want_location=True):
+    """
+    Busca club y lugar en una única pasada por las etiquetas de la página (en orden de documento).
+    El texto de un hijo está contenido en el de su padre: si una etiqueta no contiene ninguna
+    palabra clave pendiente, no se baja por su rama (antes se llamaba get_text() en todas).
+    """
+    club, location = None, None
+    stack = [soup]
+    while stack and ((want_club and not club) or (want_location and not location)):
+        tag = stack.pop()
+        raw = tag.get_text()
+        lowered = raw.lower()
+        has_club = want_club and not club and any(word in lowered for word in CLUB_KEYWORDS)
+        has_location = want_location and not location and any(word in lowered for word in LOCATION_KEYWORDS)
+        if not (has_club or has_location):
+            continue
+        if tag is not soup:
+            if has_club:
+                text = clean(raw)
+                if text and len(text) < 100:
+                    club = text
+            if has_location:
+                text = clean(raw)
+                if text and ('/' in text or any(x in text for x in ['Spain', 'España'])):
+                    location = text
+        # Hijos en orden inverso para sacarlos de la pila en orden de documento
+        stack.extend(reversed([child for child in tag.contents if isinstance(child, Tag)]))
+    return club, location
+
+def _get_thread_driver():
+    """Driver propio de cada hilo, tomado del pool la primera vez que se usa"""
+    driver = getattr(_thread_state, 'driver', None)
+    if driver is None:
+        driver = _checkout_driver()
+        if not driver:
+            raise Exception("No se pudo obtener un driver de Chrome autenticado")
+        with _drivers_lock:
+            _thread_drivers.append(driver)
+        _thread_state.driver = driver
+    return driver
+
+def _release_thread_drivers():
+    """Devuelve al pool todos los drivers usados por los hilos de trabajo"""
+    with _drivers_lock:
+        drivers = list(_thread_drivers)
+        _thread_drivers.clear()
+    for driver in drivers:
+        _checkin_driver(driver)
+
+def _fetch_event_detail(i, total, event, cached=None):
+    """Extrae la información detallada de un evento usando el driver del hilo actual"""
+    if cached and event.get('id') in cached:
+        log(f"⏭️  Evento {i}/{total} ya procesado, se reutiliza: {event.get('nombre', 'Sin nombre')}")
+        return cached[event['id']]
+    
+    try:
+        driver = _get_thread_driver()
+        
+        # PRESERVAR CAMPOS ORIGINALES IMPORTANTES
+        detailed_event = {field: event.get(field, '') for field in PRESERVED_FIELDS}
+
+        # Inicializar contador de participantes
+        detailed_event['numero_participantes'] = 0
+        detailed_event['participantes_info'] = 'No disponible'
+
+        # Verificar si tiene enlace de información
+        info_processed = False
+        if 'enlaces' in event and 'info' in event['enlaces']:
+            info_url = event['enlaces']['info']
+
+            log(f"Procesando evento {i}/{total}: {event.get('nombre', 'Sin nombre')}")
+
+            try:
+                # Obtener HTML de la página de información
+                page_html = _page_html(driver, info_url, INFO_READY_SELECTOR, INFO_READY_MARKERS)
+                soup = BeautifulSoup(page_html, HTML_PARSER)
+
+                # ===== INFORMACIÓN ADICIONAL =====
+                additional_info = {}
+
+                # Intentar mejorar club y lugar si no están completos (una sola pasada)
+                want_club = not detailed_event.get('club') or detailed_event.get('club') == 'N/D'
+                want_location = not detailed_event.get('lugar') or detailed_event.get('lugar') == 'N/D'
+                if want_club or want_location:
+                    club, location = _scan_club_and_location(soup, want_club, want_location)
+                    if club:
+                        detailed_event['club'] = club
+                    if location:
+                        detailed_event['lugar'] = location
+
+                # Extraer información general adicional
+                title_elem = soup.find('h1')
+                if title_elem:
+                    additional_info['titulo_completo'] = clean(title_elem.get_text())
+
+                # Extraer descripción limitada (máximo 800 caracteres)
+                description_text = _extract_description(soup, max_length=800)
+                if description_text:
+                    additional_info['descripcion'] = description_text
+
+                # Añadir información adicional al evento
+                detailed_event['informacion_adicional'] = additional_info
+                info_processed = True
+
+            except Exception as e:
+                log(f"  ❌ Error procesando información: {e}")
+
+        # ===== EXTRAER NÚMERO DE PARTICIPANTES =====
+        if 'enlaces' in event and 'participantes' in event['enlaces']:
+            participants_url = event['enlaces']['participantes']
+            log(f"  Extrayendo número de participantes de: {participants_url}")
+
+            try:
+                # Obtener HTML de la página de participantes
+                participants_html = _page_html(driver, participants_url,
+                                               PARTICIPANTS_READY_SELECTOR, PARTICIPANTS_READY_MARKERS)
+                participants_soup = BeautifulSoup(participants_html, HTML_PARSER)
+
+                # Contar participantes con método mejorado
+                num_participants = _count_participants_correctly(participants_soup)
+
+                if num_participants > 0:
+                    detailed_event['numero_participantes'] = num_participants
+                    detailed_event['participantes_info'] = f"{num_participants} participantes"
+                    log(f"  ✅ Encontrados {num_participants} participantes")
+                else:
+                    detailed_event['numero_participantes'] = 0
+                    detailed_event['participantes_info'] = 'Sin participantes'
+                    log(f"  ⚠️  No se encontraron participantes")
+
+            except Exception as e:
+                log(f"  ❌ Error accediendo a participantes: {e}")
+                detailed_event['numero_participantes'] = 0
+                detailed_event['participantes_info'] = f"Error: {str(e)}"
+
+        detailed_event['timestamp_extraccion'] = datetime.now().isoformat()
+        detailed_event['procesado_info'] = info_processed
+        slow_pause(1, 2)
+        return detailed_event
+
+    except Exception as e:
+        log(f"❌ Error procesando evento {i}: {str(e)}")
+        # Mantener datos básicos del evento
+        event['timestamp_extraccion'] = datetime.now().isoformat()
+        event['procesado_info'] = False
+        event['numero_participantes'] = 0
+        event['participantes_info'] = f"Error: {str(e)}"
+        return event
+
+def _save_detailed_info(detailed_events):
+    """Escribe cada evento detallado a disco según llega y muestra el resumen final.
+
+    Acepta cualquier iterable; aquí solo se acumulan los contadores, el top 5 y los ids
+    procesados. Con --module all, los resultados que terminan antes de su turno esperan
+    en la lista de futures hasta que se escriben.
+    Los ficheros se escriben en .tmp y solo se renombran al cerrar el array: si el
+    iterable falla a mitad (error de un hilo, Ctrl-C) no queda un JSON a medias.
+    """
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    output_file = os.path.join(OUT_DIR, f'02info_{today_str}.json')
+    jsonl_file = os.path.join(OUT_DIR, EVENTS_JSONL_FILE)
+
+    # Contadores + top 5 en un heap acotado (-idx desempata por orden original)
+    processed = total_participants = events_with_participants = events_with_info = 0
+    top_heap = []
+    processed_ids = []
+    tmp_output = output_file + ".tmp"
+    tmp_jsonl = jsonl_file + ".tmp"
+    try:
+        with open(tmp_output, 'w', encoding='utf-8') as json_f, \
+                open(tmp_jsonl, 'w', encoding='utf-8') as jsonl_f:
+            # Array JSON escrito elemento a elemento (mismo formato que json.dump con indent=2)
+            json_f.write("[")
+            for idx, event in enumerate(detailed_events):
+                json_f.write(",\n" if idx else "\n")
+                json_f.write(textwrap.indent(dumps(event, indent=True), "  "))
+                jsonl_f.write(dumps(event) + "\n")
+
+                processed += 1
+                num = event.get('numero_participantes', 0)
+                total_participants += num
+                if num > 0:
+                    events_with_participants += 1
+                    item = (num, -idx, {k: event[k] for k in ('id', 'nombre') if k in event})
+                    if len(top_heap) < 5:
+                        heapq.heappush(top_heap, item)
+                    else:
+                        heapq.heappushpop(top_heap, item)
+                if event.get('procesado_info', False):
+                    events_with_info += 1
+                    if event.get('id'):
+                        processed_ids.append(event['id'])
+            json_f.write("\n]" if processed else "]")
+    except BaseException:
+        for tmp in (tmp_output, tmp_jsonl):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        raise
+    os.replace(tmp_output, output_file)
+    os.replace(tmp_jsonl, jsonl_file)
+    top_events = sorted(top_heap, key=itemgetter(0, 1), reverse=True)
+
+    # Crear también un archivo sin fecha para consistencia
+    latest_file = os.path.join(OUT_DIR, '02info.json')
+    shutil.copyfile(output_file, latest_file)
+
+    log(f"✅ Información detallada guardada en {output_file} y {jsonl_file}")
+
+    # Resumen estructurado para procesos downstream y para --resume
+    summary = {
+        'eventos_procesados': processed,
+        'eventos_con_info': events_with_info,
+        'eventos_con_participantes': events_with_participants,
+        'total_participantes': total_participants,
+        'top_eventos': [
+            {'id': event.get('id', ''), 'nombre': event.get('nombre', ''), 'numero_participantes': num}
+            for num, _, event in top_events
+        ],
+        'ids_procesados': processed_ids,
+        'timestamp': datetime.now().isoformat(),
+    }
+    write_json(os.path.join(OUT_DIR, SUMMARY_FILE), summary)
+
+    # Resumen acumulado y volcado en una sola escritura
+    lines = [
+        f"\n{'='*80}",
+        "RESUMEN FINAL:",
+        f"{'='*80}",
+        f"Eventos procesados: {processed}",
+        f"Eventos con información detallada: {events_with_info}",
+        f"Eventos con participantes: {events_with_participants}",
+        f"Total participantes: {total_participants}",
+    ]
+
+    # Mostrar eventos con más participantes
+    if SHOW_TOP_EVENTS and events_with_participants > 0:
+        lines.append(f"\n📊 Eventos con más participantes:")
+        for num, _, event in top_events:
+            lines.append(_TOP_EVENT_TPL.format_map(
+                collections.ChainMap({'numero_participantes': num}, event, _MISSING)))
+
+    lines.append(f"\n{'='*80}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return summary
+
+def _load_resume_cache():
+    """Eventos ya procesados en una ejecución anterior (según summary.json + 02info.json)"""
+    summary_file = os.path.join(OUT_DIR, SUMMARY_FILE)
+    info_file = os.path.join(OUT_DIR, '02info.json')
+    if not (os.path.isfile(summary_file) and os.path.isfile(info_file)):
+        log("ℹ️  Sin resumen previo; se procesan todos los eventos")
+        return {}
+    
+    try:
+        done_ids = set(read_json(summary_file).get('ids_procesados', []))
+        previous = read_json(info_file)
+    except (OSError, ValueError) as e:
+        log(f"⚠️  No se pudo cargar el estado previo: {e}")
+        return {}
+    
+    cached = {e['id']: e for e in previous if e.get('id') in done_ids}
+    log(f"⏭️  Reanudando: {len(cached)} eventos ya procesados")
+    return cached
+
+def extract_detailed_info(workers=DETAIL_WORKERS, resume=False):
     """Extraer información detallada de cada evento incluyendo número de participantes"""
     if not HAS_SELENIUM:
         log("Error: Selenium no está instalado")
@@ -756,196 +1261,78 @@ def extract_detailed_info():
     log("=== MÓDULO 2: EXTRACCIÓN DE INFORMACIÓN DETALLADA ===")
     
     # Buscar el archivo de eventos más reciente
-    event_files = glob(os.path.join(OUT_DIR, "01events_*.json"))
-    if not event_files:
+    latest_event_file = latest_events_file(OUT_DIR)
+    if not latest_event_file:
         log("❌ No se encontraron archivos de eventos")
         return None
     
-    latest_event_file = max(event_files, key=os.path.getctime)
-    
     # Cargar eventos
-    with open(latest_event_file, 'r', encoding='utf-8') as f:
-        events = json.load(f)
+    events = read_json(latest_event_file)
     
     log(f"✅ Cargados {len(events)} eventos desde {latest_event_file}")
     
-    driver = _get_driver(headless=HEADLESS)
-    if not driver:
-        log("❌ No se pudo crear el driver de Chrome")
-        return None
+    log(f"⚙️  Procesando con {workers} hilos en paralelo")
+    _set_http_pool_size(workers)
+    cached = _load_resume_cache() if resume else None
     
     try:
-        if not _login(driver):
-            raise Exception("No se pudo iniciar sesión")
-        
-        detailed_events = []
-        
-        for i, event in enumerate(events, 1):
-            try:
-                # PRESERVAR CAMPOS ORIGINALES IMPORTANTES
-                preserved_fields = ['id', 'nombre', 'fechas', 'organizacion', 'club', 'lugar', 'enlaces', 'pais_bandera']
-                detailed_event = {field: event.get(field, '') for field in preserved_fields}
-                
-                # Inicializar contador de participantes
-                detailed_event['numero_participantes'] = 0
-                detailed_event['participantes_info'] = 'No disponible'
-                
-                # Verificar si tiene enlace de información
-                info_processed = False
-                if 'enlaces' in event and 'info' in event['enlaces']:
-                    info_url = event['enlaces']['info']
-                    
-                    log(f"Procesando evento {i}/{len(events)}: {event.get('nombre', 'Sin nombre')}")
-                    
-                    try:
-                        # Navegar a la página de información
-                        driver.get(info_url)
-                        WebDriverWait(driver, 15).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-                        
-                        slow_pause(2, 3)
-                        
-                        # Obtener HTML de la página
-                        page_html = driver.page_source
-                        soup = BeautifulSoup(page_html, 'html.parser')
-                        
-                        # ===== INFORMACIÓN ADICIONAL =====
-                        additional_info = {}
-                        
-                        # Intentar mejorar información de club si no está completa
-                        if not detailed_event.get('club') or detailed_event.get('club') in ['N/D', '']:
-                            club_elems = soup.find_all(lambda tag: any(word in tag.get_text().lower() for word in ['club', 'organizador', 'organizer']))
-                            for elem in club_elems:
-                                text = _clean(elem.get_text())
-                                if text and len(text) < 100:
-                                    detailed_event['club'] = text
-                                    break
-                        
-                        # Intentar mejorar información de lugar si no está completa
-                        if not detailed_event.get('lugar') or detailed_event.get('lugar') in ['N/D', '']:
-                            location_elems = soup.find_all(lambda tag: any(word in tag.get_text().lower() for word in ['lugar', 'ubicacion', 'location', 'place']))
-                            for elem in location_elems:
-                                text = _clean(elem.get_text())
-                                if text and ('/' in text or any(x in text for x in ['Spain', 'España'])):
-                                    detailed_event['lugar'] = text
-                                    break
-                        
-                        # Extraer información general adicional
-                        title_elem = soup.find('h1')
-                        if title_elem:
-                            additional_info['titulo_completo'] = _clean(title_elem.get_text())
-                        
-                        # Extraer descripción limitada (máximo 800 caracteres)
-                        description_text = _extract_description(soup, max_length=800)
-                        if description_text:
-                            additional_info['descripcion'] = description_text
-                        
-                        # Añadir información adicional al evento
-                        detailed_event['informacion_adicional'] = additional_info
-                        info_processed = True
-                        
-                    except Exception as e:
-                        log(f"  ❌ Error procesando información: {e}")
-                
-                # ===== EXTRAER NÚMERO DE PARTICIPANTES =====
-                if 'enlaces' in event and 'participantes' in event['enlaces']:
-                    participants_url = event['enlaces']['participantes']
-                    log(f"  Extrayendo número de participantes de: {participants_url}")
-                    
-                    try:
-                        # Navegar a la página de participantes
-                        driver.get(participants_url)
-                        WebDriverWait(driver, 15).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-                        
-                        slow_pause(2, 3)
-                        
-                        # Obtener HTML de la página de participantes
-                        participants_html = driver.page_source
-                        participants_soup = BeautifulSoup(participants_html, 'html.parser')
-                        
-                        # Contar participantes con método mejorado
-                        num_participants = _count_participants_correctly(participants_soup)
-                        
-                        if num_participants > 0:
-                            detailed_event['numero_participantes'] = num_participants
-                            detailed_event['participantes_info'] = f"{num_participants} participantes"
-                            log(f"  ✅ Encontrados {num_participants} participantes")
-                        else:
-                            detailed_event['numero_participantes'] = 0
-                            detailed_event['participantes_info'] = 'Sin participantes'
-                            log(f"  ⚠️  No se encontraron participantes")
-                            
-                    except Exception as e:
-                        log(f"  ❌ Error accediendo a participantes: {e}")
-                        detailed_event['numero_participantes'] = 0
-                        detailed_event['participantes_info'] = f"Error: {str(e)}"
-                
-                detailed_event['timestamp_extraccion'] = datetime.now().isoformat()
-                detailed_event['procesado_info'] = info_processed
-                detailed_events.append(detailed_event)
-                slow_pause(1, 2)
-                
-            except Exception as e:
-                log(f"❌ Error procesando evento {i}: {str(e)}")
-                # Mantener datos básicos del evento
-                event['timestamp_extraccion'] = datetime.now().isoformat()
-                event['procesado_info'] = False
-                event['numero_participantes'] = 0
-                event['participantes_info'] = f"Error: {str(e)}"
-                detailed_events.append(event)
-                continue
-        
-        # Guardar información detallada
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        output_file = os.path.join(OUT_DIR, f'02info_{today_str}.json')
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(detailed_events, f, ensure_ascii=False, indent=2)
-        
-        # Crear también un archivo sin fecha para consistencia
-        latest_file = os.path.join(OUT_DIR, '02info.json')
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump(detailed_events, f, ensure_ascii=False, indent=2)
-        
-        log(f"✅ Información detallada guardada en {output_file}")
-        
-        # Mostrar resumen de participantes
-        total_participants = sum(event.get('numero_participantes', 0) for event in detailed_events)
-        events_with_participants = sum(1 for event in detailed_events if event.get('numero_participantes', 0) > 0)
-        events_with_info = sum(1 for event in detailed_events if event.get('procesado_info', False))
+        total = len(events)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map conserva el orden original; cada resultado se escribe según llega
+            summary = _save_detailed_info(executor.map(
+                _fetch_event_detail, range(1, total + 1), [total] * total, events, [cached] * total
+            ))
         
-        print(f"\n{'='*80}")
-        print("RESUMEN FINAL:")
-        print(f"{'='*80}")
-        print(f"Eventos procesados: {len(detailed_events)}")
-        print(f"Eventos con información detallada: {events_with_info}")
-        print(f"Eventos con participantes: {events_with_participants}")
-        print(f"Total participantes: {total_participants}")
-        
-        # Mostrar eventos con más participantes
-        if events_with_participants > 0:
-            print(f"\n📊 Eventos con más participantes:")
-            sorted_events = sorted([e for e in detailed_events if e.get('numero_participantes', 0) > 0], 
-                                 key=lambda x: x.get('numero_participantes', 0), reverse=True)
-            for event in sorted_events[:5]:
-                print(f"  {event.get('nombre', 'N/A')}: {event.get('numero_participantes')} participantes")
+        return summary
         
-        print(f"\n{'='*80}")
+    except Exception as e:
+        log(f"❌ Error durante la extracción detallada: {e.__class__.__name__}: {e!r}")
+        if DEBUG:
+            traceback.print_exc()
+        return None
+    finally:
+        _release_thread_drivers()
+
+def _consume_futures(futures):
+    """Resultados en orden, soltando cada future en cuanto se ha escrito"""
+    for k in range(len(futures)):
+        future, futures[k] = futures[k], None
+        yield future.result()
+
+def extract_events_and_details(workers=DETAIL_WORKERS, resume=False):
+    """Módulos 1 y 2 solapados: cada evento extraído se encola para su detalle"""
+    if not HAS_SELENIUM:
+        log("Error: Selenium no está instalado")
+        return None, None
+    
+    log(f"⚙️  Información detallada en paralelo con {workers} hilos mientras se extraen eventos")
+    _set_http_pool_size(workers)
+    cached = _load_resume_cache() if resume else None
+    events = None
+    futures = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def _enqueue(i, total, event):
+                futures.append(executor.submit(_fetch_event_detail, i, total, event, cached))
+            
+            events = extract_events(on_event=_enqueue)
+            if not events:
+                for future in futures:
+                    future.cancel()
+                return None, None
+            
+            log("=== MÓDULO 2: EXTRACCIÓN DE INFORMACIÓN DETALLADA ===")
+            summary = _save_detailed_info(_consume_futures(futures))
         
-        return detailed_events
+        return events, summary
         
     except Exception as e:
-        log(f"❌ Error durante la extracción detallada: {str(e)}")
-        traceback.print_exc()
-        return None
+        log(f"❌ Error durante la extracción detallada: {e.__class__.__name__}: {e!r}")
+        if DEBUG:
+            traceback.print_exc()
+        return events, None
     finally:
-        try:
-            driver.quit()
-        except:
-            pass
+        _release_thread_drivers()
 
 # ============================== FUNCIÓN PRINCIPAL ==============================
 
@@ -956,21 +1343,51 @@ def main():
     print(f"📂 Directorio de salida: {OUT_DIR}")
     print("=" * 80)
     
+    parser = argparse.ArgumentParser(description="FlowAgility Scraper - Eventos e Info Detallada")
+    parser.add_argument("--module", choices=["events", "info", "all"], default="all", help="Módulo a ejecutar")
+    parser.add_argument("--workers", type=int, default=DETAIL_WORKERS, help="Hilos para la información detallada")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--verbose", action="store_true", help="Mostrar siempre el ranking de eventos")
+    verbosity.add_argument("--quiet", action="store_true", help="No mostrar el ranking de eventos")
+    parser.add_argument("--resume", action="store_true", help="Reutilizar los eventos ya procesados según summary.json")
+    parser.add_argument("--debug", action="store_true", help="Mostrar trazas completas de los errores")
+    args = parser.parse_args()
+    
     # Crear directorio de output
     os.makedirs(OUT_DIR, exist_ok=True)
     
-    # Limpiar archivos antiguos
-    _clean_output_directory()
+    # Limpiar archivos antiguos (se conservan al reanudar)
+    if not args.resume:
+        _clean_output_directory()
     
-    parser = argparse.ArgumentParser(description="FlowAgility Scraper - Eventos e Info Detallada")
-    parser.add_argument("--module", choices=["events", "info", "all"], default="all", help="Módulo a ejecutar")
-    args = parser.parse_args()
+    global SHOW_TOP_EVENTS
+    if args.verbose:
+        SHOW_TOP_EVENTS = True
+    elif args.quiet:
+        SHOW_TOP_EVENTS = False
     
     try:
         success = True
         
+        # Drivers pre-calentados (arranque + login) para todos los módulos
+        _warm_driver_pool(DRIVER_POOL_SIZE)
+        
+        # Módulos 1 + 2 solapados: el detalle arranca con el primer evento extraído
+        if args.module == "all":
+            log("🏁 INICIANDO EXTRACCIÓN DE EVENTOS E INFORMACIÓN DETALLADA")
+            events, detail_summary = extract_events_and_details(workers=max(1, args.workers), resume=args.resume)
+            if not events:
+                log("❌ Falló la extracción de eventos")
+                success = False
+            else:
+                log("✅ Eventos básicos extraídos correctamente")
+                if not detail_summary:
+                    log("⚠️  No se pudo extraer información detallada")
+                else:
+                    log("✅ Información detallada extraída correctamente")
+        
         # Módulo 1: Eventos básicos
-        if args.module in ["events", "all"]:
+        elif args.module == "events":
             log("🏁 INICIANDO EXTRACCIÓN DE EVENTOS BÁSICOS")
             events = extract_events()
             if not events:
@@ -980,10 +1397,10 @@ def main():
                 log("✅ Eventos básicos extraídos correctamente")
         
         # Módulo 2: Información detallada
-        if args.module in ["info", "all"] and success:
+        elif args.module == "info":
             log("🏁 INICIANDO EXTRACCIÓN DE INFORMACIÓN DETALLADA")
-            detailed_events = extract_detailed_info()
-            if not detailed_events:
+            detail_summary = extract_detailed_info(workers=max(1, args.workers), resume=args.resume)
+            if not detail_summary:
                 log("⚠️  No se pudo extraer información detallada")
             else:
                 log("✅ Información detallada extraída correctamente")
@@ -992,12 +1409,14 @@ def main():
             log("🎉 PROCESO COMPLETADO EXITOSAMENTE")
             
             # Mostrar solo archivos nuevos generados
-            print(f"\n📁 ARCHIVOS GENERADOS EN {OUT_DIR}:")
-            output_files = glob(os.path.join(OUT_DIR, "*"))
-            for file in sorted(output_files):
-                if os.path.isfile(file):
-                    size = os.path.getsize(file)
-                    print(f"   {os.path.basename(file)} - {size} bytes")
+            lines = [f"\n📁 ARCHIVOS GENERADOS EN {OUT_DIR}:"]
+            with os.scandir(OUT_DIR) as it:
+                output_entries = sorted(it, key=lambda e: e.name)
+            for entry in output_entries:
+                if entry.is_file():
+                    size = entry.stat().st_size
+                    lines.append(f"   {entry.name} - {size} bytes")
+            sys.stdout.write("\n".join(lines) + "\n")
                     
         else:
             log("❌ PROCESO COMPLETADO CON ERRORES")
@@ -1005,9 +1424,13 @@ def main():
         return success
         
     except Exception as e:
-        log(f"❌ ERROR CRÍTICO DURANTE LA EJECUCIÓN: {e}")
-        traceback.print_exc()
+        log(f"❌ ERROR CRÍTICO DURANTE LA EJECUCIÓN: {e.__class__.__name__}: {e!r}")
+        if DEBUG:
+            traceback.print_exc()
         return False
+    finally:
+        _close_http_session()
+        _drain_driver_pool()
 
 if __name__ == "__main__":
     success = main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utilidades comunes de los scrapers de FlowAgility
+=================================================
+
+Importadas por EventosProxBeta.py, EventosProxconParticipantes.py y
+extraerParticipantesEventosProx.py: limpieza de texto, JSON, localización del
+último 01events_*.json, el switch --module y esperas explícitas de Selenium.
+Así cada ajuste se hace en un solo sitio.
+"""
+
+import os
+import re
+import json
+import unicodedata
+from functools import lru_cache
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    HAS_SELENIUM = True
+except ImportError:
+    HAS_SELENIUM = False
+
+# Recursos que no aportan texto: se bloquean por CDP (Network.setBlockedURLs) en todos los scripts
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+# ============================== TEXTO ==============================
+
+WHITESPACE_RE = re.compile(r"[ \t]+")
+STRIP_CHARS = " \t\r\n-•*·:;"
+
+def _clean_text(s: str) -> str:
+    # ASCII (flag O(1) en CPython) ya es NFKC; si no, Quick Check (sin copia) antes de normalizar
+    if not s.isascii() and not unicodedata.is_normalized("NFKC", s):
+        s = unicodedata.normalize("NFKC", s)
+    return WHITESPACE_RE.sub(" ", s).strip(STRIP_CHARS)
+
+# Textos cortos (clubes, lugares, fechas, "N/D"...) se repiten mucho entre eventos: memoizados
+_clean_short = lru_cache(maxsize=65536)(_clean_text)
+CLEAN_CACHE_MAX_LEN = 256
+
+def clean(s: str) -> str:
+    """Limpia y normaliza texto"""
+    if not s:
+        return ""
+    s = str(s)
+    return _clean_short(s) if len(s) <= CLEAN_CACHE_MAX_LEN else _clean_text(s)
+
+# ============================== JSON (orjson si está disponible) ==============================
+
+def dumps(obj, indent=False) -> str:
+    """Serializa a str UTF-8 sin escapar (orjson si está disponible; mismo formato que json.dumps)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+def write_json(path, obj):
+    """Vuelca obj con indentación de 2 y UTF-8 sin escapar (mismo formato que json.dump)."""
+    if HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+def read_json(path):
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# ============================== FICHEROS DE SALIDA ==============================
+
+def latest_events_file(out_dir):
+    """01events_YYYY-MM-DD.json más reciente: un solo scandir y orden por la fecha del nombre (sin stat)."""
+    try:
+        with os.scandir(out_dir) as it:
+            names = [e.name for e in it if e.name.startswith("01events_") and e.name.endswith(".json")]
+    except FileNotFoundError:
+        return None
+    # Las fechas ISO del nombre ordenan lexicográficamente
+    return os.path.join(out_dir, max(names)) if names else None
+
+# ============================== CLI ==============================
+
+MODULES = ("events", "info", "all")
+
+def parse_module(argv):
+    """
+    Único switch de la CLI (--module X / --module=X) leído directamente de argv.
+    argparse solo se importa para --help o argumentos no reconocidos (mensajes de uso y error).
+    """
+    if not argv:
+        return "all"
+    if len(argv) == 1 and argv[0].startswith("--module=") and argv[0].split("=", 1)[1] in MODULES:
+        return argv[0].split("=", 1)[1]
+    if len(argv) == 2 and argv[0] == "--module" and argv[1] in MODULES:
+        return argv[1]
+    import argparse
+    parser = argparse.ArgumentParser(description="FlowAgility Scraper - Eventos e Info Detallada")
+    parser.add_argument("--module", choices=list(MODULES), default="all", help="Módulo a ejecutar")
+    return parser.parse_args(argv).module
+
+# ============================== SELENIUM ==============================
+
+def wait_for_selector(driver, css_selector, timeout=15, log=print):
+    """Espera a que aparezca el elemento que se va a extraer (sin pausas fijas).
+
+    log es la función de log del script que llama, para que el aviso salga con su formato.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+        )
+        return True
+    except TimeoutException:
+        log(f"  ⚠️  Timeout esperando '{css_selector}', se analiza la página tal cual")
+        return False